@@ -1,9 +1,27 @@
+import os
 import random
-from entropy_wordleai import WORDS, get_feedback, select_best_guess, filter_words
+import time
+import entropy_wordleai
+from entropy_wordleai import (WORDS, get_feedback, next_guess, filter_words, get_guess_cache, get_opening_book,
+                              initial_guess_pool)
+from wordleCore import entropy_solver
+from wordleCore.batch_solver import solve_batch
+from wordleCore.candidate_set import CandidateSet
+from wordleCore.hard_mode import update_guess_pool
+from wordleCore.outcome_cache import code_fingerprint
+from wordleCore.result_store import ResultStore
+from wordleCore.sim_engine import run_games
+from wordleCore.telemetry import NORMAL, VERBOSE, game_summary, log, phase, phase_report, set_verbosity
 
 STATS_FILE = "entropyAlgo/wordle_stats.txt"
 FAILED_FILE = "entropyAlgo/failed_words_entropy.txt"
 NUM_GAMES = 1  # Change as needed
+EXHAUSTIVE = False  # True plays every target word once instead of NUM_GAMES random draws
+NUM_WORKERS = os.cpu_count()  # processes playing games, 1 plays them in this process
+VERBOSITY = NORMAL  # SILENT, QUIET (one JSON line per game), NORMAL or VERBOSE
+RECORD_RESULTS = True  # append every game to the result store (results/games.sqlite)
+BATCH_SOLVE = False  # True plays the games in lockstep, scoring each distinct state once (same results, one process)
+SCORING_POLICY = None  # None keeps the solver's; or a name in entropy_engine.SCORING_POLICIES to compare strategies
 
 # Load stats from file
 def load_stats():
@@ -37,63 +55,110 @@ def save_failed_words(failed_words):
         for word in sorted(failed_words):
             f.write(word + "\n")
 
-def play_one_game(answer):
-    candidates = WORDS[:]
+def play_turns(answer, history):
+    candidates = CandidateSet.all()
+    pool = initial_guess_pool()
     for turn in range(6):
         if not candidates:
-            print(f"No candidates left on turn {turn+1} for answer {answer}")
+            log(f"No candidates left on turn {turn+1} for answer {answer}")
             return None
-        # First turn: use entropy over all WORDS, then restrict to candidates
-        if turn == 0:
-            guess = select_best_guess(WORDS)
-        else:
-            guess = select_best_guess(candidates)
-        print(f"Turn {turn+1}: Guess = {guess}, Candidates left = {len(candidates)}")
-        feedback = get_feedback(guess, answer)
-        print(f"Feedback: {feedback}")
-        candidates = filter_words(candidates, guess, feedback)
-        print(f"Candidates after filtering: {len(candidates)}")
-        print(f"Candidates: {candidates}")
-        if answer in candidates:
-            print(f"Answer {answer} is still in candidate list.")
-        else:
-            print(f"Answer {answer} has been filtered out!")
+        # Opening book covers the first turns, then live entropy search on the candidates
+        with phase("scoring"):
+            guess = next_guess(candidates, history, pool)
+        with phase("feedback"):
+            feedback = get_feedback(guess, answer)
+        history.append((guess, feedback))
+        with phase("filtering"):
+            candidates = filter_words(candidates, guess, feedback)
+            pool = update_guess_pool(pool, guess, feedback)
+        log(f"Turn {turn+1}: Guess = {guess}, Feedback = {feedback}, Candidates left = {len(candidates)}")
+        log(f"Candidates: {candidates}", VERBOSE)
+        if answer not in candidates:
+            log(f"Answer {answer} has been filtered out!")
+        if feedback == "ggggg":
+            log(f"Solved {answer} in {turn+1} guesses!")
+            return turn + 1
         if len(candidates) == 1:
             final_guess = candidates[0]
-            print(f"Candidate list shrunk to 1: {final_guess}")
             final_feedback = get_feedback(final_guess, answer)
-            print(f"Final guess: {final_guess}, Answer: {answer}, Feedback: {final_feedback}")
+            history.append((final_guess, final_feedback))
+            log(f"Final guess: {final_guess}, Answer: {answer}, Feedback: {final_feedback}", VERBOSE)
             if final_feedback == "ggggg":
-                print(f"Solved {answer} in {turn+2} guesses!")
+                log(f"Solved {answer} in {turn+2} guesses!")
                 return turn + 2
             else:
-                print(f"Failed to solve {answer}. Final guess {final_guess} did not match.")
+                log(f"Failed to solve {answer}. Final guess {final_guess} did not match.")
                 return None
-        if feedback == "ggggg":
-            print(f"Solved {answer} in {turn+1} guesses!")
-            return turn + 1
-    print(f"Failed to solve {answer} in 6 guesses.")
+    log(f"Failed to solve {answer} in 6 guesses.")
     return None
 
+def play_one_game(answer):
+    start = time.perf_counter()
+    history = []
+    guesses = play_turns(answer, history)
+    path = [guess for guess, _ in history]
+    seconds = round(time.perf_counter() - start, 6)
+    game_summary(answer=answer, guesses=guesses, path=path, seconds=seconds)
+    if RECORD_RESULTS:
+        get_result_store().add(answer, guesses, path, seconds)
+    return guesses
+
+# Play every answer in lockstep (see wordleCore/batch_solver.py); the run time is split evenly across games
+def play_batch(answers):
+    start = time.perf_counter()
+    batch = solve_batch(answers, next_guess, initial_guess_pool())
+    seconds = round((time.perf_counter() - start) / max(len(answers), 1), 6)
+    for answer, guesses, path in batch.results():
+        game_summary(answer=answer, guesses=guesses, path=path, seconds=seconds)
+        if RECORD_RESULTS:
+            get_result_store().add(answer, guesses, path, seconds)
+    log(f"Lockstep: {len(answers)} games, {sum(batch.states_scored)} distinct states scored")
+    return batch.tally()
+
+_result_store = None
+
+# Store for this run's games, versioned by the solver and game-playing code. Other scoring
+# policies and hard mode games are recorded as separate solvers.
+def get_result_store():
+    global _result_store
+    if _result_store is None:
+        name = entropy_wordleai.solver_key()
+        if entropy_wordleai.HARD_MODE:
+            name += "-hard"
+        _result_store = ResultStore(name, code_fingerprint([entropy_wordleai, entropy_solver, play_turns]))
+    return _result_store
+
 def main():
-    tally = load_stats()
-    num_games = NUM_GAMES 
-    failed_words = set()
-    for i in range(num_games):
-        answer = random.choice(WORDS)
-        guesses = play_one_game(answer)
-        if guesses is not None and 1 <= guesses <= 6:
-            tally[str(guesses)] += 1
-        elif guesses is None:
-            tally["failed"] += 1
-            failed_words.add(answer)
-    save_stats(tally)
-    save_failed_words(failed_words)
+    set_verbosity(VERBOSITY)
+    if SCORING_POLICY is not None:
+        entropy_wordleai.SCORING_POLICY = SCORING_POLICY
+    store = get_result_store()
+    default_solver = store.solver == entropy_wordleai.SOLVER_NAME  # normal mode, entropy scoring
+    if default_solver:
+        store.import_legacy_tally(load_stats())  # keeps games tallied before the store existed
+    if EXHAUSTIVE:
+        answers = list(WORDS)
+    else:
+        answers = [random.choice(WORDS) for _ in range(NUM_GAMES)]
+    get_opening_book()  # build once here rather than in every worker
+    if BATCH_SOLVE:
+        _, failed_words = play_batch(answers)
+    else:
+        _, failed_words = run_games(play_one_game, answers, NUM_WORKERS)
+    store.flush()
+    # wordle_stats.txt and the failed words file are regenerated from every recorded default-solver game
+    tally = store.tally()
+    if default_solver:
+        save_stats(tally)
+        save_failed_words(store.failed_words())
     print("\n--- Data Collection Results ---")
     for n in range(1, 7):
         print(f"Solved in {n} guesses: {tally[str(n)]} times | {tally[str(n)] / (sum(tally[str(n)] for n in range(1,7)) + tally['failed']) * 100:.2f}%")
     print(f"Failed: {tally['failed']} times | {tally['failed'] / (sum(tally[str(n)] for n in range(1,7)) + tally['failed']) * 100:.2f}%")
     print(f"Total games: {sum(tally[str(n)] for n in range(1,7)) + tally['failed']}")
+    if NUM_WORKERS == 1 or BATCH_SOLVE:
+        print(f"Guess cache: {get_guess_cache().stats()}")
+    print(phase_report())
     if failed_words:
         print("\nWords that failed in this run:")
         for word in sorted(failed_words):
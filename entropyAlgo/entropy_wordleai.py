@@ -3,9 +3,18 @@
 
 from collections import Counter, defaultdict
 import math
+import os
+import sys
 
-with open("wordle_targets.txt", "r") as f:
-    WORDS = [w.strip().lower() for w in f.readlines() if len(w.strip()) == 5]
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wordleCore import entropy_engine
+from wordleCore.candidate_set import CandidateSet
+from wordleCore.entropy_solver import EntropySolver, filter_words
+from wordleCore.hard_mode import update_guess_pool
+from wordleCore.pattern_matrix import get_pattern_table
+from wordleCore.vocabulary import get_answers
+
+WORDS = get_answers()
 
 # Generate Wordle feedback for a guess against the answer
 def get_feedback(guess, answer):
@@ -28,9 +37,11 @@ def get_feedback(guess, answer):
 
 # Calculate entropy for a guess given current candidates
 def entropy_for_guess(guess, candidates):
+    table = get_pattern_table()
+    row = table.row(guess)
     pattern_counts = defaultdict(int)
     for answer in candidates:
-        pattern = get_feedback(guess, answer)
+        pattern = row[table.answer_index[answer]]
         pattern_counts[pattern] += 1
     total = len(candidates)
     entropy = 0.0
@@ -39,29 +50,30 @@ def entropy_for_guess(guess, candidates):
         entropy -= p * math.log2(p)
     return entropy
 
-# Select the guess with maximum expected entropy
-def select_best_guess(candidates):
-    best_guess = None
-    best_entropy = -1
-    # Always use full WORDS list for guesses (Knuth-style)
-    for guess in WORDS:
-        ent = entropy_for_guess(guess, candidates)
-        if ent > best_entropy:
-            best_entropy = ent
-            best_guess = guess
-    return best_guess
+SOLVER_NAME = "entropy"  # names this solver's cached guesses, opening book and decision tree
+SCORING_POLICY = "entropy"  # how guesses are scored, a name in entropy_engine.SCORING_POLICIES
+GUESS_POOL = WORDS  # Always use full WORDS list for guesses (Knuth-style)
+OPENING_BOOK_DEPTH = 2  # turns covered by the opening book
+USE_DECISION_TREE = True  # follow a compiled tree (python wordleCore/decision_tree.py) when one exists
+HARD_MODE = False  # only play guesses that use every revealed hint (NYT hard mode)
 
-# Filter candidates based on feedback
-def filter_words(candidates, guess, feedback):
-    filtered = []
-    for word in candidates:
-        if get_feedback(guess, word) == feedback:
-            filtered.append(word)
-    return filtered
+# Guess cache, opening book, decision tree and hard mode pools for the settings above
+# (see wordleCore/entropy_solver.py); earliest guess wins ties
+_solver = EntropySolver(sys.modules[__name__])
+solver_key = _solver.solver_key
+code_key = _solver.code_key
+get_guess_cache = _solver.get_guess_cache
+select_best_guess = _solver.select_best_guess
+get_opening_book = _solver.get_opening_book
+get_decision_tree = _solver.get_decision_tree
+initial_guess_pool = _solver.initial_guess_pool
+next_guess = _solver.next_guess
 
 # Interactive main for entropy-based guessing
 def main():
-    candidates = WORDS[:]
+    candidates = CandidateSet.all()
+    history = []
+    pool = initial_guess_pool()
     print("Entropy-based Wordle Assistant")
     print("Enter your guess and feedback each round.")
     print("Feedback format: g = green, y = yellow, . = gray: .g.gy for green in pos 2 and 4 and yellow in pos 5")
@@ -70,22 +82,29 @@ def main():
         print(f"\nRemaining candidates: {len(candidates)}")
         if len(candidates) <= 50:
             print(candidates)
+        if len(candidates) > 1:
+            print(f"\nBest guess: {next_guess(candidates, history, pool)}")
         if candidates:
-            ranked = sorted(candidates, key=lambda w: entropy_for_guess(w, candidates), reverse=True)
+            ranked = entropy_engine.rank_guesses(candidates, candidates, k=5)  # candidates always use every hint
             print("\nTop recommended guesses (by entropy):")
-            for w in ranked[:5]:
-                print(f"  {w} (entropy: {entropy_for_guess(w, candidates):.4f})")
+            for w, ent in ranked:
+                print(f"  {w} (entropy: {ent:.4f})")
         guess = input("\nEnter your guess (or 'quit'): ").strip().lower()
         if guess == "quit":
             break
         if len(guess) != 5 or guess not in WORDS:
             print("Invalid guess. Must be a 5-letter word from the list.")
             continue
+        if pool is not None and guess not in pool:
+            print("Invalid guess. Hard mode: the guess must use every revealed hint.")
+            continue
         feedback = input("Enter feedback (g/y/.): ").strip().lower()
         if len(feedback) != 5 or not all(c in "gy." for c in feedback):
             print("Invalid feedback. Must be 5 chars using g/y/.")
             continue
+        history.append((guess, feedback))
         candidates = filter_words(candidates, guess, feedback)
+        pool = update_guess_pool(pool, guess, feedback)
         if len(candidates) == 1:
             print(f"\nThe answer must be: {candidates[0]}")
             break
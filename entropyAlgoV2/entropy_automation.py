@@ -1,7 +1,12 @@
 import sys
 import os
 sys.path.append(os.path.dirname(__file__))
-from entropy_wordleai import select_best_guess, filter_words, entropy_for_guess, WORDS
+from entropy_wordleai import next_guess, filter_words, initial_guess_pool
+from wordleCore.candidate_set import CandidateSet
+from wordleCore.hard_mode import update_guess_pool
+from wordleCore.speculation import Speculator
+from wordleCore.wordle_page import WordlePage, mock_url
+from wordleCore.entropy_engine import rank_guesses
 
 from selenium import webdriver
 from selenium.webdriver.edge.service import Service as EdgeService
@@ -12,10 +17,10 @@ import time
 EDGE_DRIVER_PATH = r"msedgedriver.exe"
 WORDLE_URL = "https://www.nytimes.com/games/wordle/index.html"
 
-def launch_wordle():
+def launch_wordle(url=WORDLE_URL):
     service = EdgeService(EDGE_DRIVER_PATH)
     driver = webdriver.Edge(service=service)
-    driver.get(WORDLE_URL)
+    driver.get(url)
     time.sleep(5)  # Wait for page to load
     return driver
 
@@ -44,30 +49,24 @@ def close_popups(driver):
     except Exception:
         pass
 
-def get_board_state(driver):
-    # Get the current board state (letters and colors)
-    board = []
-    rows = driver.find_elements(By.CSS_SELECTOR, "div.Row-module_row__pwpBq")
-    for row in rows:
-        tiles = row.find_elements(By.CSS_SELECTOR, "div.Tile-module_tile__UWEHN")
-        word = []
-        for tile in tiles:
-            letter = tile.get_attribute("data-letter")
-            color = tile.get_attribute("data-state")  # can either be 'correct', 'present', 'absent', or ''
-            word.append((letter, color))
-        if word:
-            board.append(word)
-    return board
-
-def main():
-    driver = launch_wordle()
-    close_popups(driver)
+# Solve the puzzle at url (the NYT page, or mock_url() to time a solve offline)
+def main(url=WORDLE_URL):
+    driver = launch_wordle(url)
+    if url == WORDLE_URL:
+        close_popups(driver)
+    page = WordlePage(driver)
     print("Wordle loaded. Board state:")
-    board = get_board_state(driver)
+    board = page.read_board()
     for row in board:
         print(row)
 
-    candidates = WORDS[:]
+    candidates = CandidateSet.all()
+    history = []
+    pool = initial_guess_pool()  # set HARD_MODE in entropy_wordleai.py if the account plays hard mode
+    # Next guesses for the likeliest feedback are computed while the tiles flip
+    speculator = Speculator(next_guess, filter_words)
+    speculated = None
+    start = time.perf_counter()
     for turn in range(6):
         print("First 50 candidates:", candidates[:20])
         if len(candidates) == 1:
@@ -78,43 +77,34 @@ def main():
             break
         else:
             # Print top 5 guesses by entropy
-            ranked = sorted(candidates, key=lambda w: entropy_for_guess(w, candidates), reverse=True)
+            ranked = rank_guesses(candidates, candidates, k=5)
             print(f"\nTop recommended guesses (by entropy):")
-            for w in ranked[:5]:
-                print(f"  {w} (entropy: {entropy_for_guess(w, candidates):.4f})")
-            guess = select_best_guess(candidates)
+            for w, ent in ranked:
+                print(f"  {w} (entropy: {ent:.4f})")
+            guess = speculated or next_guess(candidates, history, pool)
             print(f"\nTurn {turn+1}: Entering guess: {guess}")
-        for letter in guess:
-            driver.find_element(By.TAG_NAME, 'body').send_keys(letter)
-            time.sleep(0.1)
-        driver.find_element(By.TAG_NAME, 'body').send_keys("\ue007")
-        time.sleep(3)
-
-        board = get_board_state(driver)
+        # Speculation runs while the row flips; the board comes back with the revealed row
+        feedback, board = page.play(guess, turn, lambda: speculator.start(candidates, history, pool, guess))
         print(f"\nBoard state after guess {guess}:")
         for row in board:
             print(row)
 
-        # get feedback from the latest row
-        feedback_row = board[turn]
-        feedback = ''
-        for letter, state in feedback_row:
-            if state == 'correct':
-                feedback += 'g'
-            elif state == 'present':
-                feedback += 'y'
-            elif state == 'absent':
-                feedback += '.'
-            else:
-                feedback += '.'
-
+        history.append((guess, feedback))
         candidates = filter_words(candidates, guess, feedback)
+        pool = update_guess_pool(pool, guess, feedback)
 
         if feedback == 'ggggg':
             print(f"\nSolved! The answer is: {guess}")
             break
+        speculated = speculator.take(feedback)
+
+    speculator.shutdown()
+    print(f"\nEnd-to-end solve time: {time.perf_counter() - start:.2f}s ({page.stats()}; {speculator.stats()})")
 
     # driver.quit()  # Uncomment to close browser when done
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == "mock":
+        main(mock_url(sys.argv[2] if len(sys.argv) > 2 else None))
+    else:
+        main()
@@ -1,41 +1,25 @@
-# Two-step lookahead entropy (2-ply)
-def select_best_guess_2ply(candidates):
-    best_guess = None
-    best_value = float('-inf')
-    for guess in VALID_GUESSES:
-        # Map feedback pattern to list of answers
-        pattern_counts = defaultdict(list)
-        for answer in candidates:
-            pattern = get_feedback(guess, answer)
-            pattern_counts[pattern].append(answer)
-        total = len(candidates)
-        expected_entropy = 0.0
-        for pattern, answers_for_pattern in pattern_counts.items():
-            prob = len(answers_for_pattern) / total
-            # For this feedback, what is the best next guess's entropy?
-            if len(answers_for_pattern) <= 1:
-                entropy2 = 0.0
-            else:
-                # Find the best second guess for this reduced set
-                entropy2 = max(entropy_for_guess(g2, answers_for_pattern) for g2 in VALID_GUESSES)
-            expected_entropy += prob * entropy2
-        if expected_entropy > best_value:
-            best_value = expected_entropy
-            best_guess = guess
-    return best_guess
 # Entropy-based Wordle AI (Knuth-style minimax)
 # Uses entropy to select guesses that maximize information gain
 
 from collections import Counter, defaultdict
 import math
+import os
+import sys
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wordleCore import lookahead
+from wordleCore.candidate_set import CandidateSet
+from wordleCore.entropy_solver import EntropySolver, filter_words
+from wordleCore.hard_mode import update_guess_pool
+from wordleCore.pattern_matrix import get_pattern_table
+from wordleCore.vocabulary import get_answers, get_guesses
 
-# Load all possible answer words
-with open("wordle_targets.txt", "r") as f:
-    ANSWERS = [w.strip().lower() for w in f.readlines() if len(w.strip()) == 5]
-# Load all valid guess words (including answers)
-with open("wordle_bank.txt", "r") as f:
-    VALID_GUESSES = [w.strip().lower() for w in f.readlines() if len(w.strip()) == 5]
+
+# All possible answer words
+ANSWERS = get_answers()
+WORDS = ANSWERS  # name shared with the V1 solver, simulation and automation
+# All valid guess words (including answers)
+VALID_GUESSES = get_guesses()
 
 # Generate Wordle feedback for a guess against the answer
 def get_feedback(guess, answer):
@@ -58,9 +42,11 @@ def get_feedback(guess, answer):
 
 # Calculate entropy for a guess given current candidates
 def entropy_for_guess(guess, candidates):
+    table = get_pattern_table()
+    row = table.row(guess)
     pattern_counts = defaultdict(int)
     for answer in candidates:
-        pattern = get_feedback(guess, answer)
+        pattern = row[table.answer_index[answer]]
         pattern_counts[pattern] += 1
     total = len(candidates)
     entropy = 0.0
@@ -69,29 +55,49 @@ def entropy_for_guess(guess, candidates):
         entropy -= p * math.log2(p)
     return entropy
 
-# Select the guess with maximum expected entropy
-def select_best_guess(candidates):
-    best_guess = None
-    best_entropy = -1
-    # Use all valid guesses for entropy calculation
-    for guess in VALID_GUESSES:
-        ent = entropy_for_guess(guess, candidates)
-        if ent > best_entropy:
-            best_entropy = ent
-            best_guess = guess
-    return best_guess
+SOLVER_NAME = "entropyV2"  # names this solver's cached guesses, opening book and decision tree
+SCORING_POLICY = "entropy"  # how guesses are scored, a name in entropy_engine.SCORING_POLICIES
+GUESS_POOL = VALID_GUESSES  # Use all valid guesses for entropy calculation
+OPENING_BOOK_DEPTH = 2  # turns covered by the opening book
+USE_DECISION_TREE = True  # follow a compiled tree (python wordleCore/decision_tree.py) when one exists
+HARD_MODE = False  # only play guesses that use every revealed hint (NYT hard mode)
+
+# Guess cache, opening book, decision tree and hard mode pools for the settings above
+# (see wordleCore/entropy_solver.py); earliest guess wins ties
+_solver = EntropySolver(sys.modules[__name__])
+solver_key = _solver.solver_key
+code_key = _solver.code_key
+get_guess_cache = _solver.get_guess_cache
+select_best_guess = _solver.select_best_guess
+get_opening_book = _solver.get_opening_book
+get_decision_tree = _solver.get_decision_tree
+initial_guess_pool = _solver.initial_guess_pool
+next_guess = _solver.next_guess
+
+TWO_PLY_FIRST_BEAM = 100  # first guesses searched by 2-ply (top by 1-ply entropy), None = all (exact)
+TWO_PLY_SECOND_BEAM = 2000  # follow-up guesses tried per bucket, None = all (exact)
+TWO_PLY_WORKERS = os.cpu_count()  # processes sharing the 2-ply search, 1 searches in this process
 
-# Filter candidates based on feedback
-def filter_words(candidates, guess, feedback):
-    filtered = []
-    for word in candidates:
-        if get_feedback(guess, word) == feedback:
-            filtered.append(word)
-    return filtered
+# Two-step lookahead entropy (2-ply): the guess whose own entropy plus the expected entropy of
+# the best follow-up guess is highest. Pruned with upper bounds, exact unless beams are set
+# (see wordleCore/lookahead.py).
+def select_best_guess_2ply(candidates, pool=None):
+    guess, value, search = lookahead.select_best_guess_2ply(
+        candidates, VALID_GUESSES if pool is None else pool, TWO_PLY_FIRST_BEAM, TWO_PLY_SECOND_BEAM, workers=TWO_PLY_WORKERS
+    )
+    return guess
+
+# Top k guesses by 2-ply expected entropy (from the hard mode pool if given), plus the search for its stats
+def rank_guesses_2ply(candidates, k=5, pool=None):
+    return lookahead.rank_guesses_2ply(
+        candidates, VALID_GUESSES if pool is None else pool, k, TWO_PLY_FIRST_BEAM, TWO_PLY_SECOND_BEAM, workers=TWO_PLY_WORKERS
+    )
 
 # Interactive main for entropy-based guessing
 def main():
-    candidates = ANSWERS[:]
+    candidates = CandidateSet.all()
+    history = []
+    pool = initial_guess_pool()
     print("Entropy-based Wordle Assistant")
     print("Enter your guess and feedback each round.")
     print("Feedback format: g = green, y = yellow, . = gray: .g.gy for green in pos 2 and 4 and yellow in pos 5")
@@ -100,31 +106,14 @@ def main():
         print(f"\nRemaining candidates: {len(candidates)}")
         if len(candidates) <= 50:
             print(candidates)
+        if len(candidates) > 1:
+            print(f"\nBest guess: {next_guess(candidates, history, pool)}")
         if candidates:
-            # Compute 2-ply expected entropy for all valid guesses
-            guess_entropies = []
-            total_guesses = len(VALID_GUESSES)
-            for idx, w in enumerate(VALID_GUESSES):
-                print(f"[Progress] Evaluating guess {idx+1}/{total_guesses}: {w}")
-                pattern_counts = defaultdict(list)
-                for answer in candidates:
-                    pattern = get_feedback(w, answer)
-                    pattern_counts[pattern].append(answer)
-                total = len(candidates)
-                expected_entropy = 0.0
-                for pidx, (pattern, answers_for_pattern) in enumerate(pattern_counts.items()):
-                    print(f"    [Subprogress] {w}: feedback {pidx+1}/{len(pattern_counts)} ({pattern})")
-                    prob = len(answers_for_pattern) / total
-                    if len(answers_for_pattern) <= 1:
-                        entropy2 = 0.0
-                    else:
-                        entropy2 = max(entropy_for_guess(g2, answers_for_pattern) for g2 in VALID_GUESSES)
-                    expected_entropy += prob * entropy2
-                guess_entropies.append((w, expected_entropy))
-            print("[Progress] 2-ply entropy calculation complete.")
-            ranked = sorted(guess_entropies, key=lambda x: x[1], reverse=True)
+            # 2-ply expected entropy, first guesses spread across TWO_PLY_WORKERS processes
+            ranked, search = rank_guesses_2ply(candidates, pool=pool)
+            print(f"[Progress] 2-ply entropy calculation complete: {search.stats()}")
             print("\nTop recommended guesses (by 2-ply expected entropy):")
-            for w, ent in ranked[:5]:
+            for w, ent in ranked:
                 print(f"  {w} (2-ply expected entropy: {ent:.4f})")
         guess = input("\nEnter your guess (or 'quit'): ").strip().lower()
         if guess == "quit":
@@ -132,11 +121,16 @@ def main():
         if len(guess) != 5 or guess not in VALID_GUESSES:
             print("Invalid guess. Must be a 5-letter word from the valid guess list.")
             continue
+        if pool is not None and guess not in pool:
+            print("Invalid guess. Hard mode: the guess must use every revealed hint.")
+            continue
         feedback = input("Enter feedback (g/y/.): ").strip().lower()
         if len(feedback) != 5 or not all(c in "gy." for c in feedback):
             print("Invalid feedback. Must be 5 chars using g/y/.")
             continue
+        history.append((guess, feedback))
         candidates = filter_words(candidates, guess, feedback)
+        pool = update_guess_pool(pool, guess, feedback)
         if len(candidates) == 1:
             print(f"\nThe answer must be: {candidates[0]}")
             break
@@ -1,6 +1,8 @@
 import sys
 sys.path.append('.')  # Ensure current directory is in path
-from greedyAlgo.greedy_wordleai import filter_words, score_word, WORDS
+from greedyAlgo.greedy_wordleai import ALL_WORDS_MASK, best_allowed_guess, filter_mask, initial_guess_pool
+from wordleCore.hard_mode import update_guess_pool
+from wordleCore.wordle_page import WordlePage, mock_url
 
 from selenium import webdriver
 from selenium.webdriver.edge.service import Service as EdgeService
@@ -11,10 +13,10 @@ import time
 EDGE_DRIVER_PATH = r"msedgedriver.exe"
 WORDLE_URL = "https://www.nytimes.com/games/wordle/index.html"
 
-def launch_wordle():
+def launch_wordle(url=WORDLE_URL):
     service = EdgeService(EDGE_DRIVER_PATH)
     driver = webdriver.Edge(service=service)
-    driver.get(WORDLE_URL)
+    driver.get(url)
     time.sleep(5)  # Wait for page to load
     return driver
 
@@ -43,89 +45,52 @@ def close_popups(driver):
     except Exception:
         pass
 
-def get_board_state(driver):
-    # Get the current board state (letters and colors)
-    board = []
-    rows = driver.find_elements(By.CSS_SELECTOR, "div.Row-module_row__pwpBq")
-    for row in rows:
-        tiles = row.find_elements(By.CSS_SELECTOR, "div.Tile-module_tile__UWEHN")
-        word = []
-        for tile in tiles:
-            letter = tile.get_attribute("data-letter")
-            color = tile.get_attribute("data-state")  # can either be 'correct', 'present', 'absent', or ''
-            word.append((letter, color))
-        if word:
-            board.append(word)
-    return board
-
-def main():
-    driver = launch_wordle()
-    close_popups(driver)
+# Solve the puzzle at url (the NYT page, or mock_url() to time a solve offline)
+def main(url=WORDLE_URL):
+    driver = launch_wordle(url)
+    if url == WORDLE_URL:
+        close_popups(driver)
+    page = WordlePage(driver)
     print("Wordle loaded. Board state:")
-    board = get_board_state(driver)
+    board = page.read_board()
     for row in board:
         print(row)
 
     greens = {}
     yellows = {}
     grays = {}
-    candidates = WORDS[:]
+    mask = ALL_WORDS_MASK
+    pool = initial_guess_pool()  # set HARD_MODE in greedy_wordleai.py if the account plays hard mode
+    start = time.perf_counter()
 
     for turn in range(6):
         # pick best guess
-        if candidates:
-            guess = max(candidates, key=score_word)
+        if mask:
+            guess = best_allowed_guess(mask, pool)
         else:
             print("No candidates left. Stopping.")
             break
         print(f"\nTurn {turn+1}: Entering guess: {guess}")
-        for letter in guess:
-            driver.find_element(By.TAG_NAME, 'body').send_keys(letter)
-            time.sleep(0.1)
-        driver.find_element(By.TAG_NAME, 'body').send_keys("\ue007")
-        time.sleep(3)
-
-        board = get_board_state(driver)
+        feedback, board = page.play(guess, turn)
         print(f"\nBoard state after guess {guess}:")
         for row in board:
             print(row)
 
-        # get feedback from the latest row
-        feedback_row = board[turn]
-        feedback = ''
-        for pos, (letter, state) in enumerate(feedback_row):
-            if state == 'correct':
-                feedback += 'g'
-            elif state == 'present':
-                feedback += 'y'
-            elif state == 'absent':
-                feedback += '.'
-            else:
-                feedback += '.'
-
-        # update known info
-        for pos, (letter, mark) in enumerate(zip(guess, feedback)):
-            if mark == "g":  # green
-                greens[pos] = letter
-            elif mark == "y":  # yellow
-                if pos not in yellows:
-                    yellows[pos] = []
-                yellows[pos].append(letter)
-            else:  # gray
-                required_count = (
-                    list(greens.values()).count(letter) +
-                    sum(letter in lst for lst in yellows.values())
-                )
-                grays[letter] = required_count
-
-        candidates = filter_words(greens, yellows, grays)
+        # update known info and narrow the previous candidates
+        mask = filter_mask(mask, greens, yellows, grays, guess, feedback)
+        pool = update_guess_pool(pool, guess, feedback)
 
         # check for win
         if feedback == 'ggggg':
             print(f"\nSolved! The answer is: {guess}")
             break
 
+    print(f"\nEnd-to-end solve time: {time.perf_counter() - start:.2f}s ({page.stats()})")
+
     # driver.quit()  # Uncomment to close browser when done
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == "mock":
+        main(mock_url(sys.argv[2] if len(sys.argv) > 2 else None))
+    else:
+        main()
@@ -1,8 +1,24 @@
+import os
 import random
-from greedyAlgo.greedy_wordleai import filter_words, score_word, WORDS
+import sys
+import time
+import numpy as np
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from greedyAlgo import greedy_wordleai
+from greedyAlgo.greedy_wordleai import ALL_WORDS_MASK, best_allowed_guess, filter_mask, initial_guess_pool, WORDS
+from wordleCore.hard_mode import update_guess_pool
+from wordleCore.outcome_cache import code_fingerprint, load_outcome_cache
+from wordleCore.result_store import ResultStore
+from wordleCore.sim_engine import run_games
+from wordleCore.telemetry import NORMAL, QUIET, game_summary, get_verbosity, phase, phase_report, set_verbosity
 
 STATS_FILE = "greedyAlgo/wordle_stats.txt"
 NUM_GAMES = 1  # Change as needed
+EXHAUSTIVE = False  # True plays every target word once instead of NUM_GAMES random draws
+NUM_WORKERS = os.cpu_count()  # processes playing games, 1 plays them in this process
+VERBOSITY = NORMAL  # SILENT, QUIET (one JSON line per game) or NORMAL (throttled progress)
+USE_OUTCOME_CACHE = True  # the solver is deterministic, so sample from each answer's cached outcome
+RECORD_RESULTS = True  # append every game to the result store (results/games.sqlite)
 
 # Generate Wordle feedback for a guess against the answer
 def get_feedback(guess, answer):
@@ -49,55 +65,99 @@ def save_stats(tally):
             f.write(f"{i}: {tally[str(i)]}\n")
         f.write(f"failed: {tally['failed']}\n")
 
-# Simulate one game
-def play_one_game(answer):
+# Simulate one game, returning (guesses or None, guess path)
+def play_game(answer):
     greens = {}
     yellows = {}
     grays = {}
-    candidates = WORDS[:]
+    mask = ALL_WORDS_MASK
+    pool = initial_guess_pool()
+    path = []
     for turn in range(6):
-        if not candidates:
-            return None
-        guess = max(candidates, key=score_word)
-        feedback = get_feedback(guess, answer)
-        # Update knowledge
-        for pos, (letter, mark) in enumerate(zip(guess, feedback)):
-            if mark == "g":
-                greens[pos] = letter
-            elif mark == "y":
-                if pos not in yellows:
-                    yellows[pos] = []
-                yellows[pos].append(letter)
-            else:
-                required_count = (
-                    list(greens.values()).count(letter) +
-                    sum(letter in lst for lst in yellows.values())
-                )
-                grays[letter] = required_count
-        candidates = filter_words(greens, yellows, grays)
+        if not mask:
+            return None, path
+        with phase("scoring"):
+            guess = best_allowed_guess(mask, pool)
+        with phase("feedback"):
+            feedback = get_feedback(guess, answer)
+        path.append(guess)
+        # Update knowledge and narrow the previous turn's candidates
+        with phase("filtering"):
+            mask = filter_mask(mask, greens, yellows, grays, guess, feedback)
+            pool = update_guess_pool(pool, guess, feedback)
         if feedback == "ggggg":
-            return turn + 1
-    return None
+            return turn + 1, path
+    return None, path
+
+def play_one_game(answer):
+    start = time.perf_counter()
+    guesses, path = play_game(answer)
+    seconds = round(time.perf_counter() - start, 6)
+    game_summary(answer=answer, guesses=guesses, path=path, seconds=seconds)
+    if RECORD_RESULTS:
+        get_result_store().add(answer, guesses, path, seconds)
+    return guesses
+
+# Identifies the scoring code and settings, for the outcome cache and recorded results
+def code_version():
+    return code_fingerprint(
+        [greedy_wordleai, play_game, get_feedback],
+        {"adaptive": greedy_wordleai.ADAPTIVE_SCORING, "positional_weight": greedy_wordleai.POSITIONAL_WEIGHT,
+         "hard_mode": greedy_wordleai.HARD_MODE},
+    )
+
+# Outcome of every answer, rebuilt whenever the word list, scoring code or settings change
+def get_outcome_cache():
+    return load_outcome_cache(solver_name(), play_game, WORDS, code_version())
+
+# Hard mode games are cached and recorded as a separate solver
+def solver_name():
+    return "greedy-hard" if greedy_wordleai.HARD_MODE else "greedy"
+
+_result_store = None
+
+def get_result_store():
+    global _result_store
+    if _result_store is None:
+        _result_store = ResultStore(solver_name(), code_version())
+    return _result_store
 
 def main():
-    tally = load_stats()
-    num_games = NUM_GAMES
-    failed_words = set()
-    for i in range(num_games):
-        answer = random.choice(WORDS)
-        guesses = play_one_game(answer)
-        if guesses is not None and 1 <= guesses <= 6:
-            tally[str(guesses)] += 1
-        elif guesses is None:
-            tally["failed"] += 1
-            failed_words.add(answer)
-        # Discard runs that end before 6 guesses (already handled)
-    save_stats(tally)
+    set_verbosity(VERBOSITY)
+    store = get_result_store()
+    if not greedy_wordleai.HARD_MODE:
+        store.import_legacy_tally(load_stats())  # keeps games tallied before the store existed
+    if USE_OUTCOME_CACHE:
+        outcomes = get_outcome_cache()
+        counts = np.ones(len(WORDS), dtype=np.int64) if EXHAUSTIVE else outcomes.sample_counts(NUM_GAMES)
+        _, failed_words = outcomes.tally(counts)
+        # One row per drawn answer standing for all of its identical games (cached games take no time to play)
+        for answer, count in zip(outcomes.answers, counts):
+            if not count:
+                continue
+            if get_verbosity() == QUIET:
+                for _ in range(count):
+                    game_summary(answer=answer, guesses=outcomes.guesses(answer), path=outcomes.path(answer),
+                                 seconds=None)
+            if RECORD_RESULTS:
+                store.add(answer, outcomes.guesses(answer), outcomes.path(answer), games=int(count))
+    else:
+        if EXHAUSTIVE:
+            answers = list(WORDS)
+        else:
+            answers = [random.choice(WORDS) for _ in range(NUM_GAMES)]
+        _, failed_words = run_games(play_one_game, answers, NUM_WORKERS)
+    store.flush()
+    # wordle_stats.txt is regenerated from every recorded normal-mode game
+    tally = store.tally()
+    if not greedy_wordleai.HARD_MODE:
+        save_stats(tally)
     print("\n--- Data Collection Results ---")
     for n in range(1, 7):
         print(f"Solved in {n} guesses: {tally[str(n)]} times | {tally[str(n)] / (sum(tally[str(n)] for n in range(1,7)) + tally['failed']) * 100:.2f}%")
     print(f"Failed: {tally['failed']} times | {tally['failed'] / (sum(tally[str(n)] for n in range(1,7)) + tally['failed']) * 100:.2f}%")
     print(f"Total games: {sum(tally[str(n)] for n in range(1,7)) + tally['failed']}")
+    print(phase_report())
     if failed_words:
         print("\nWords that failed in this run:")
         for word in sorted(failed_words):
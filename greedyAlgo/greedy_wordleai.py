@@ -1,9 +1,17 @@
 # Wordle Assistant
 # Usage: python wordle_helper.py
 
-# Load word list (adjust file path if needed)
-with open("wordle_targets.txt", "r") as f:
-    WORDS = [w.strip().lower() for w in f.readlines() if len(w.strip()) == 5]
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wordleCore.hard_mode import GuessPool, update_guess_pool
+from wordleCore.vocabulary import get_answers
+
+# Load word list
+WORDS = get_answers()
 
 # Calculate letter frequencies in WORDS
 from collections import Counter
@@ -16,42 +24,179 @@ def score_word(word):
     return sum(letter_counts[c] for c in set(word))
 
 
-def filter_words(greens: dict, yellows: dict, grays: dict):
-    candidates = []
-    for word in WORDS:
-        valid = True
+# Scoring matrices over WORDS
+# LETTER_PRESENCE[i, c]: 1 if letter c appears in WORDS[i]
+# LETTER_POSITIONS[i, 26 * pos + c]: 1 if WORDS[i] has letter c at pos
+ADAPTIVE_SCORING = False  # True recounts letter frequencies over the live candidates each turn
+POSITIONAL_WEIGHT = 0.0  # weight of per-position letter frequencies added to the score
+LETTER_PRESENCE = np.zeros((len(WORDS), 26), dtype=np.float64)
+LETTER_POSITIONS = np.zeros((len(WORDS), 26 * 5), dtype=np.float64)
+for i, word in enumerate(WORDS):
+    for pos, letter in enumerate(word):
+        LETTER_PRESENCE[i, ord(letter) - ord('a')] = 1
+        LETTER_POSITIONS[i, 26 * pos + ord(letter) - ord('a')] = 1
+STATIC_SCORES = LETTER_PRESENCE @ np.array([letter_counts[chr(ord('a') + c)] for c in range(26)], dtype=np.float64)
 
-        # Green checks
-        for pos, letter in greens.items():
-            if word[pos] != letter:
-                valid = False
-                break
 
-        if not valid:
-            continue
+# Positional inverted index over WORDS as bitsets (bit i set = WORDS[i] matches)
+# POSITION_INDEX[pos][letter]: words with letter at pos
+# COUNT_INDEX[letter][n]: words containing letter at least n times (n = 0..5)
+ALL_WORDS_MASK = (1 << len(WORDS)) - 1
+POSITION_INDEX = [{} for _ in range(5)]
+COUNT_INDEX = {}
+for i, word in enumerate(WORDS):
+    bit = 1 << i
+    for pos, letter in enumerate(word):
+        POSITION_INDEX[pos][letter] = POSITION_INDEX[pos].get(letter, 0) | bit
+    for letter, count in Counter(word).items():
+        thresholds = COUNT_INDEX.setdefault(letter, [ALL_WORDS_MASK] + [0] * 5)
+        for n in range(1, count + 1):
+            thresholds[n] |= bit
 
-        # Yellow checks
-        for pos, letters in yellows.items():
-            for letter in letters:
-                if letter not in word or word[pos] == letter:
-                    valid = False
-                    break
-            if not valid:
-                break
 
-        if not valid:
-            continue
+def green_mask(pos, letter):
+    return POSITION_INDEX[pos].get(letter, 0)
+
+
+# Letter somewhere in the word, but not at pos
+def yellow_mask(pos, letter):
+    if letter not in COUNT_INDEX:
+        return 0
+    return COUNT_INDEX[letter][1] & ~POSITION_INDEX[pos].get(letter, 0)
+
+
+# Letter appears at most max_allowed times
+def gray_mask(letter, max_allowed):
+    if letter not in COUNT_INDEX or max_allowed >= 5:
+        return ALL_WORDS_MASK
+    return ALL_WORDS_MASK & ~COUNT_INDEX[letter][max_allowed + 1]
+
+
+# Bitset of every word satisfying all accumulated constraints
+def constraint_mask(greens: dict, yellows: dict, grays: dict):
+    mask = ALL_WORDS_MASK
+    for pos, letter in greens.items():
+        mask &= green_mask(pos, letter)
+    for pos, letters in yellows.items():
+        for letter in letters:
+            mask &= yellow_mask(pos, letter)
+    for letter, max_allowed in grays.items():
+        mask &= gray_mask(letter, max_allowed)
+    return mask
+
+
+# Words in a bitset, in WORDS order
+def mask_to_words(mask):
+    words = []
+    while mask:
+        low = mask & -mask
+        words.append(WORDS[low.bit_length() - 1])
+        mask ^= low
+    return words
+
+
+# Indices into WORDS of the words in a bitset, ascending
+def mask_to_indices(mask):
+    bits = np.unpackbits(np.frombuffer(mask.to_bytes((len(WORDS) + 7) // 8, "little"), dtype=np.uint8),
+                         bitorder="little")
+    return np.flatnonzero(bits[:len(WORDS)])
+
+
+# Score every candidate in one matrix-vector product. Static scoring uses the import-time
+# letter counts (same as score_word); adaptive scoring recounts them over the candidates.
+def score_candidates(indices, adaptive=None, positional_weight=None):
+    adaptive = ADAPTIVE_SCORING if adaptive is None else adaptive
+    positional_weight = POSITIONAL_WEIGHT if positional_weight is None else positional_weight
+    if adaptive:
+        presence = LETTER_PRESENCE[indices]
+        scores = presence @ presence.sum(axis=0)
+    else:
+        scores = STATIC_SCORES[indices]
+    if positional_weight:
+        positions = LETTER_POSITIONS[indices]
+        scores = scores + positional_weight * (positions @ positions.sum(axis=0))
+    return scores
 
-        # Gray checks
-        for letter, max_allowed in grays.items():
-            if word.count(letter) > max_allowed:
-                valid = False
-                break
 
-        if valid:
-            candidates.append(word)
+# Highest scoring candidate in the bitset (earliest in WORDS on ties), or None if empty
+def best_guess(mask, adaptive=None, positional_weight=None):
+    indices = mask_to_indices(mask)
+    if not len(indices):
+        return None
+    return WORDS[indices[np.argmax(score_candidates(indices, adaptive, positional_weight))]]
 
-    return candidates
+
+# Top k (word, score) pairs from the bitset, best first
+def rank_guesses(mask, k=5, adaptive=None, positional_weight=None):
+    indices = mask_to_indices(mask)
+    scores = score_candidates(indices, adaptive, positional_weight)
+    order = np.argsort(-scores, kind="stable")[:k]
+    return [(WORDS[indices[i]], float(scores[i])) for i in order]
+
+
+# Bitset of the words flagged True in a per-word boolean array
+def flags_to_mask(flags):
+    return int.from_bytes(np.packbits(flags, bitorder="little").tobytes(), "little")
+
+
+HARD_MODE = False  # only play guesses that use every revealed hint (NYT hard mode)
+
+
+# Guess pool for a new game: every word in hard mode, None (no restriction) otherwise
+def initial_guess_pool():
+    return GuessPool(WORDS) if HARD_MODE else None
+
+
+# Best candidate that is allowed by the hard mode pool; if no candidate is allowed (the filter's
+# duplicate-letter handling is looser than hard mode), the best allowed word instead
+def best_allowed_guess(mask, pool=None):
+    if pool is None:
+        return best_guess(mask)
+    allowed = flags_to_mask(pool.flags())
+    return best_guess(mask & allowed or allowed)
+
+
+def filter_words(greens: dict, yellows: dict, grays: dict):
+    return mask_to_words(constraint_mask(greens, yellows, grays))
+
+
+# Fold one guess's feedback into the knowledge dicts. Returns False if an earlier constraint
+# was loosened or replaced (a gray letter's allowed count went up, or a green changed letter).
+def update_knowledge(greens: dict, yellows: dict, grays: dict, guess, feedback):
+    previous_greens = dict(greens)
+    previous_grays = dict(grays)
+    for pos, (letter, mark) in enumerate(zip(guess, feedback)):
+        if mark == "g":  # green
+            greens[pos] = letter
+        elif mark == "y":  # yellow
+            if pos not in yellows:
+                yellows[pos] = []
+            yellows[pos].append(letter)
+        else:  # gray
+            # Count how many times this letter is "needed" elsewhere
+            required_count = (
+                list(greens.values()).count(letter) +
+                sum(letter in lst for lst in yellows.values())
+            )
+            # Store max allowed occurrences
+            grays[letter] = required_count
+    return (all(greens[pos] == letter for pos, letter in previous_greens.items()) and
+            all(grays[letter] <= previous_grays[letter] for letter in previous_grays))
+
+
+# Candidates after a guess, narrowed from the previous turn's bitset. Only this guess's
+# constraints are intersected unless an earlier one loosened, then it rebuilds from the index.
+def filter_mask(mask, greens: dict, yellows: dict, grays: dict, guess, feedback):
+    if not update_knowledge(greens, yellows, grays, guess, feedback):
+        return constraint_mask(greens, yellows, grays)
+    for pos, (letter, mark) in enumerate(zip(guess, feedback)):
+        if mark == "g":
+            mask &= green_mask(pos, letter)
+        elif mark == "y":
+            mask &= yellow_mask(pos, letter)
+        else:
+            mask &= gray_mask(letter, grays[letter])
+    return mask
 
 
 def main():
@@ -59,7 +204,9 @@ def main():
     yellows = {}         # {pos: [letters]}
     grays = {}           # {letter: max_allowed}
 
-    candidates = WORDS[:]
+    mask = ALL_WORDS_MASK
+    pool = initial_guess_pool()
+    candidates = list(WORDS)
 
     print("Wordle (i'm Ass)istant")
     print("Enter your guess and feedback each round.")
@@ -73,10 +220,10 @@ def main():
 
             # Recommend best guesses based on letter frequency
             if candidates:
-                ranked = sorted(candidates, key=score_word, reverse=True)
                 print("\nTop recommended guesses:")
-                for w in ranked[:5]:
-                    print(f"  {w} (score: {score_word(w)})")
+                allowed = mask if pool is None else mask & flags_to_mask(pool.flags())
+                for w, score in rank_guesses(allowed, k=5):
+                    print(f"  {w} (score: {score:g})")
         elif len(candidates) > 50:
             print("Candidates are too many to display. Need more information, try one of the following:")
 
@@ -86,31 +233,19 @@ def main():
         if len(guess) != 5 or guess not in WORDS:
             print("Invalid guess. Must be a 5-letter word from the list.")
             continue
+        if pool is not None and guess not in pool:
+            print("Invalid guess. Hard mode: the guess must use every revealed hint.")
+            continue
 
         feedback = input("Enter feedback (g/y/.): ").strip().lower()
         if len(feedback) != 5 or not all(c in "gy." for c in feedback):
             print("Invalid feedback. Must be 5 chars using g/y/.")
             continue
 
-        # Update knowledge
-        for pos, (letter, mark) in enumerate(zip(guess, feedback)):
-            if mark == "g":  # green
-                greens[pos] = letter
-            elif mark == "y":  # yellow
-                if pos not in yellows:
-                    yellows[pos] = []
-                yellows[pos].append(letter)
-            else:  # gray
-                # Count how many times this letter is "needed" elsewhere
-                required_count = (
-                    list(greens.values()).count(letter) +
-                    sum(letter in lst for lst in yellows.values())
-                )
-                # Store max allowed occurrences
-                grays[letter] = required_count
-
-        # Re-filter candidates
-        candidates = filter_words(greens, yellows, grays)
+        # Update knowledge and narrow the previous candidates
+        mask = filter_mask(mask, greens, yellows, grays, guess, feedback)
+        pool = update_guess_pool(pool, guess, feedback)
+        candidates = mask_to_words(mask)
 
         if len(candidates) == 1:
             print(f"\n The answer must be: {candidates[0]}")
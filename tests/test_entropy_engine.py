@@ -0,0 +1,27 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wordleCore import entropy_engine
+
+
+def custom_score(stats):
+    return -stats.worst_bucket
+
+
+def test_policy_name_for_registered_policies():
+    assert entropy_engine.policy_name(None) == "entropy"
+    assert entropy_engine.policy_name("minimax") == "minimax"
+    assert entropy_engine.policy_name(entropy_engine.minimax_score) == "minimax"
+
+
+def test_policy_name_for_plain_functions_is_stable():
+    assert entropy_engine.policy_name(custom_score) == "custom_score"
+
+
+@pytest.mark.parametrize("policy", [lambda stats: stats.entropy, "no-such-policy"])
+def test_policy_name_rejects_unnamed_or_unknown_policies(policy):
+    with pytest.raises(ValueError):
+        entropy_engine.policy_name(policy)
@@ -0,0 +1,27 @@
+import importlib.util
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "entropyAlgo"))
+import entropy_wordleai
+
+
+def load_policy(path, source):
+    path.write_text(source)
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.score
+
+
+# Editing a callable scoring policy must change the key of everything cached from its guesses
+def test_code_key_follows_callable_policy_source(tmp_path, monkeypatch):
+    keys = []
+    for i, source in enumerate(["def score(stats):\n    return stats.entropy\n",
+                                "def score(stats):\n    return -stats.worst_bucket\n"]):
+        monkeypatch.setattr(entropy_wordleai, "SCORING_POLICY", load_policy(tmp_path / f"policy{i}.py", source))
+        keys.append(entropy_wordleai.code_key())
+    assert entropy_wordleai.solver_key() == "entropy-score"
+    assert keys[0] != keys[1]
@@ -0,0 +1,43 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wordleCore import lookahead
+from wordleCore.candidate_set import CandidateSet
+from wordleCore.pattern_matrix import get_pattern_table
+
+
+def charged_bytes(memo):
+    return sum(len(key) + lookahead.MEMO_ENTRY_OVERHEAD for key in memo.entries)
+
+
+# Beamed searches over different candidate sets each use a different second-guess pool; together
+# they must stay within the one process-wide budget
+def test_beamed_searches_share_one_memo_budget(monkeypatch):
+    budget = 64 * 1024
+    memo = lookahead.SubsetMemo(budget)
+    monkeypatch.setattr(lookahead, "_memo", memo)
+    table = get_pattern_table()
+    rng = np.random.default_rng(0)
+    pools = set()
+    for _ in range(6):
+        candidates = CandidateSet(np.sort(rng.choice(len(table.answers), 300, replace=False)), table)
+        search = lookahead.search_2ply(candidates, table.answers, beam1=20, beam2=200, table=table)
+        pools.add(search.memo.pool_key)
+        assert memo.used_bytes <= budget
+        assert memo.used_bytes == charged_bytes(memo)
+    assert len(pools) > 1
+    assert len(memo.entries) < memo.misses  # the budget forced evictions
+
+
+# The same subset under two different second-guess pools is kept as two entries
+def test_memo_keys_include_the_pool():
+    memo = lookahead.SubsetMemo()
+    a = lookahead.PoolMemo(memo, b"a" * 16)
+    b = lookahead.PoolMemo(memo, b"b" * 16)
+    key = lookahead.subset_key([1, 2, 3])
+    a.put(key, (1.0, 0, 2))
+    assert b.get(key) is None
+    assert a.get(key) == (1.0, 0, 2)
@@ -0,0 +1,36 @@
+import os
+import sys
+import threading
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "entropyAlgo"))
+import entropy_wordleai
+from wordleCore.candidate_set import CandidateSet
+from wordleCore.speculation import Speculator
+
+
+# The automation appends the turn to its history while speculation is still queued; the
+# speculated guess must be the one next_guess gives for the real state
+def test_speculated_guess_matches_next_guess():
+    seen = []
+
+    def next_guess(candidates, history, pool):
+        seen.append(list(history))
+        return entropy_wordleai.next_guess(candidates, history, pool)
+
+    speculator = Speculator(next_guess, entropy_wordleai.filter_words, max_patterns=3)
+    release = threading.Event()
+    speculator.executor.submit(release.wait)  # hold the worker until the history has moved on
+    candidates, history, guess = CandidateSet.all(), [], "raise"
+    try:
+        speculator.start(candidates, history, None, guess)
+        feedback = "....."  # the likeliest pattern for raise, so it was speculated
+        history.append((guess, feedback))
+        release.set()
+        speculated = speculator.take(feedback)
+    finally:
+        speculator.shutdown()
+    remaining = entropy_wordleai.filter_words(candidates, guess, feedback)
+    assert speculated == entropy_wordleai.next_guess(remaining, history, None)
+    assert all(len(h) == 1 and h[0][0] == guess for h in seen)  # this turn only, once
@@ -0,0 +1,117 @@
+# Lockstep batch solving
+# Plays a list of answers together, one turn at a time. Games that have seen the same
+# (guess, feedback) history are in the same state, so each turn asks the solver for one guess per
+# distinct state and splits that state's games by the feedback their answers give. A sweep over
+# every target then costs about as much as scoring its distinct states (a few hundred to a few
+# thousand) instead of one solver call per game per turn.
+#
+# Games follow the simulators' rules (play_turns in entropy_simulation.py): a game ends on the
+# turn its answer is guessed, and otherwise once one candidate is left it is guessed next, so each
+# answer gets the same path and guess count as playing it alone (and as decision_tree.py counts).
+#
+# Usage: python wordleCore/batch_solver.py entropyAlgo [policy]   (or entropyAlgoV2; sweeps every target)
+
+import importlib
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wordleCore.candidate_set import CandidateSet
+from wordleCore.hard_mode import update_guess_pool
+from wordleCore.pattern_matrix import ALL_GREEN, code_to_pattern, get_pattern_table
+from wordleCore.sim_engine import empty_tally, record_result
+from wordleCore.telemetry import phase
+
+MAX_GUESSES = 6
+
+
+class BatchResult:
+    def __init__(self, answers, guesses, paths, states_scored):
+        self.answers = answers
+        self.guesses = guesses  # per game: guesses taken, or None if it failed
+        self.paths = paths  # per game: every guess played
+        self.states_scored = states_scored  # distinct states scored on each turn
+
+    # (answer, guesses, path) per game, in the order the answers were given
+    def results(self):
+        return zip(self.answers, self.guesses, self.paths)
+
+    # Tally in the wordle_stats.txt format (what save_stats writes) and the answers that failed
+    def tally(self):
+        tally, failed_words = empty_tally(), set()
+        for answer, guesses in zip(self.answers, self.guesses):
+            record_result(tally, failed_words, answer, guesses)
+        return tally, failed_words
+
+
+# Play every answer with next_guess_fn(candidates, history, pool), scoring each distinct state
+# once per turn. pool is the starting hard-mode GuessPool (None when every guess is allowed).
+def solve_batch(answers, next_guess_fn, pool=None, table=None, max_guesses=MAX_GUESSES):
+    table = table or get_pattern_table()
+    answers = list(answers)
+    unknown = [a for a in answers if a not in table.answer_index]
+    if unknown:
+        raise ValueError(f"not target words: {', '.join(sorted(set(unknown))[:5])}")
+    answer_idx = np.array([table.answer_index[a] for a in answers], dtype=np.intp)
+    guesses = [None] * len(answers)
+    paths = [[] for _ in answers]
+    states_scored = []
+
+    def finish(games, path, count):
+        for game in games:
+            guesses[game] = count
+            paths[game] = path
+
+    # (history, candidates, pool, positions of the games in this state)
+    states = [([], CandidateSet.all(table), pool, np.arange(len(answers)))] if answers else []
+    for turn in range(max_guesses):
+        if not states:
+            break
+        states_scored.append(len(states))
+        next_states = []
+        for history, candidates, state_pool, games in states:
+            with phase("scoring"):
+                guess = next_guess_fn(candidates, history, state_pool)
+            with phase("feedback"):
+                codes = table.row(guess)[answer_idx[games]]
+            with phase("filtering"):
+                for code in np.unique(codes):
+                    group = games[codes == code]
+                    feedback = code_to_pattern(code)
+                    child_history = history + [(guess, feedback)]
+                    path = [g for g, _ in child_history]
+                    remaining = candidates.filter(guess, int(code))
+                    if code == ALL_GREEN:
+                        finish(group, path, turn + 1)
+                    elif len(remaining) == 1:
+                        finish(group, path + [remaining[0]], turn + 2)  # the answer, guessed next
+                    elif turn + 1 >= max_guesses:
+                        finish(group, path, None)
+                    else:
+                        next_states.append((child_history, remaining,
+                                            update_guess_pool(state_pool, guess, feedback), group))
+        states = next_states
+    return BatchResult(answers, guesses, paths, states_scored)
+
+
+if __name__ == "__main__":
+    solver_dir = sys.argv[1] if len(sys.argv) > 1 else "entropyAlgo"
+    sys.path.insert(0, os.path.abspath(solver_dir))
+    solver = importlib.import_module("entropy_wordleai")
+    if len(sys.argv) > 2:
+        solver.SCORING_POLICY = sys.argv[2]
+    start = time.perf_counter()
+    batch = solve_batch(solver.WORDS, solver.next_guess, solver.initial_guess_pool())
+    elapsed = time.perf_counter() - start
+    tally, failed_words = batch.tally()
+    total = len(batch.answers)
+    for n in range(1, MAX_GUESSES + 1):
+        print(f"Solved in {n} guesses: {tally[str(n)]} answers | {tally[str(n)] / total * 100:.2f}%")
+    print(f"Failed: {tally['failed']} answers | {tally['failed'] / total * 100:.2f}%")
+    print(f"Played {total} games in {elapsed:.2f}s, scoring {sum(batch.states_scored)} distinct states "
+          f"({' + '.join(str(n) for n in batch.states_scored)} per turn)")
+    if failed_words:
+        print(f"Failed words: {' '.join(sorted(failed_words))}")
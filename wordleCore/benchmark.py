@@ -0,0 +1,235 @@
+# Benchmark suite
+# Times the hot paths on fixed, seeded workloads and reports throughput and per-call percentiles.
+# Results are saved as JSON baselines under benchmarks/ so later runs can be compared against them.
+#
+# Usage:
+#   python wordleCore/benchmark.py run [name]              run every benchmark, save benchmarks/<name>.json
+#   python wordleCore/benchmark.py compare [name] [other]  run (or load other) and flag regressions vs <name>
+# name defaults to "baseline". compare exits with status 1 if anything regressed.
+
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "entropyAlgo"))
+from wordleCore.guess_cache import GuessCache
+from wordleCore.telemetry import SILENT, set_verbosity
+
+BENCHMARK_DIR = os.path.join(ROOT_DIR, "benchmarks")
+BENCHMARK_VERSION = 1
+SEED = 2315
+REPEATS = 3  # passes over each workload; percentiles are taken over every timed call
+REGRESSION_THRESHOLD = 0.25  # flag a benchmark whose median call is this much slower than the baseline
+
+
+# A benchmark is a name plus setup(rng) -> list of zero-argument calls, each timed once per pass
+def feedback_workload(rng):
+    from entropy_wordleai import get_feedback
+    from wordleCore.vocabulary import get_answers, get_guesses
+    guesses, answers = get_guesses(), get_answers()
+    pairs = [(rng.choice(guesses), rng.choice(answers)) for _ in range(5000)]
+    return [lambda g=g, a=a: get_feedback(g, a) for g, a in pairs]
+
+
+# Whole rows of the batched kernel: 100 random guesses against every answer per call
+def feedback_matrix_workload(rng):
+    from wordleCore.feedback_kernel import feedback_matrix
+    from wordleCore.vocabulary import answer_array, get_guesses
+    answers = answer_array()
+    blocks = [rng.sample(get_guesses(), 100) for _ in range(10)]
+    return [lambda b=b: feedback_matrix(b, answers) for b in blocks]
+
+
+# Candidate set after one random guess against a random answer, for a realistic mid-game state
+def _random_states(rng, count):
+    from entropy_wordleai import get_feedback
+    from wordleCore.candidate_set import CandidateSet
+    from wordleCore.vocabulary import get_answers, get_guesses
+    guesses, answers = get_guesses(), get_answers()
+    states = []
+    for _ in range(count):
+        guess, answer = rng.choice(guesses), rng.choice(answers)
+        states.append(CandidateSet.all().filter(guess, get_feedback(guess, answer)))
+    return states
+
+
+def entropy_filter_workload(rng):
+    from entropy_wordleai import filter_words, get_feedback
+    from wordleCore.candidate_set import CandidateSet
+    from wordleCore.vocabulary import get_guesses
+    calls = []
+    for candidates in [CandidateSet.all()] + _random_states(rng, 199):
+        guess, answer = rng.choice(get_guesses()), rng.choice(candidates.words())
+        feedback = get_feedback(guess, answer)
+        calls.append(lambda c=candidates, g=guess, f=feedback: filter_words(c, g, f))
+    return calls
+
+
+# Knowledge states reached while playing real greedy games
+def greedy_filter_workload(rng):
+    from greedyAlgo.greedy_simulation import get_feedback, play_game
+    from greedyAlgo.greedy_wordleai import filter_words, update_knowledge
+    from wordleCore.vocabulary import get_answers
+    calls = []
+    for answer in rng.sample(get_answers(), 200):
+        greens, yellows, grays = {}, {}, {}
+        for guess in play_game(answer)[1]:
+            update_knowledge(greens, yellows, grays, guess, get_feedback(guess, answer))
+            state = (dict(greens), {pos: list(letters) for pos, letters in yellows.items()}, dict(grays))
+            calls.append(lambda s=state: filter_words(*s))
+    return calls
+
+
+def entropy_for_guess_workload(rng):
+    from entropy_wordleai import WORDS, entropy_for_guess
+    states = [c.words() for c in _random_states(rng, 100)]
+    return [lambda g=rng.choice(WORDS), c=c: entropy_for_guess(g, c) for c in states]
+
+
+# Uncached: the solver's guess cache is swapped for one that keeps nothing
+def _disable_guess_cache(solver):
+    key = solver.solver_key()
+    solver._solver.guess_caches[key] = GuessCache(key, solver.GUESS_POOL, solver.code_key(),
+                                                  max_entries=0, on_disk=False)
+
+
+def select_best_guess_workload(rng):
+    import entropy_wordleai as solver
+    _disable_guess_cache(solver)
+    states = [c for c in _random_states(rng, 60) if len(c) > 1]
+    return [lambda c=c: solver.select_best_guess(c) for c in states]
+
+
+def greedy_game_workload(rng):
+    from greedyAlgo import greedy_simulation
+    from wordleCore.vocabulary import get_answers
+    greedy_simulation.RECORD_RESULTS = False
+    return [lambda a=a: greedy_simulation.play_one_game(a) for a in rng.sample(get_answers(), 500)]
+
+
+# Live search on every turn after the opening book (compiled tree and guess cache off)
+def entropy_game_workload(rng):
+    import entropy_simulation
+    import entropy_wordleai as solver
+    from wordleCore.vocabulary import get_answers
+    solver.USE_DECISION_TREE = False
+    _disable_guess_cache(solver)
+    entropy_simulation.RECORD_RESULTS = False
+    solver.get_opening_book()
+    return [lambda a=a: entropy_simulation.play_one_game(a) for a in rng.sample(get_answers(), 40)]
+
+
+BENCHMARKS = {
+    "get_feedback": feedback_workload,
+    "feedback_matrix": feedback_matrix_workload,
+    "entropy.filter_words": entropy_filter_workload,
+    "greedy.filter_words": greedy_filter_workload,
+    "entropy_for_guess": entropy_for_guess_workload,
+    "select_best_guess": select_best_guess_workload,
+    "greedy.play_one_game": greedy_game_workload,
+    "entropy.play_one_game": entropy_game_workload,
+}
+
+
+def run_benchmark(name, setup, repeats=REPEATS):
+    calls = setup(random.Random(f"{SEED}:{name}"))
+    for call in calls:  # untimed pass: lazy loads and first touches of the mapped matrix
+        call()
+    timings = []
+    for _ in range(repeats):
+        for call in calls:
+            start = time.perf_counter()
+            call()
+            timings.append(time.perf_counter() - start)
+    timings = np.array(timings) * 1e6
+    return {
+        "calls": len(timings),
+        "calls_per_sec": round(len(timings) / (timings.sum() / 1e6), 2),
+        "mean_us": round(float(timings.mean()), 3),
+        "p50_us": round(float(np.percentile(timings, 50)), 3),
+        "p90_us": round(float(np.percentile(timings, 90)), 3),
+        "p99_us": round(float(np.percentile(timings, 99)), 3),
+    }
+
+
+def run_all(names=None):
+    set_verbosity(SILENT)
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        results[name] = run_benchmark(name, setup)
+        print_result(name, results[name])
+    return {
+        "version": BENCHMARK_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()}, {os.cpu_count()} cpus",
+        "results": results,
+    }
+
+
+def print_result(name, result):
+    print(f"{name:<24} {result['calls_per_sec']:>12.1f} calls/s  p50 {result['p50_us']:>10.1f} us  "
+          f"p90 {result['p90_us']:>10.1f} us  p99 {result['p99_us']:>10.1f} us")
+
+
+def baseline_path(name):
+    return os.path.join(BENCHMARK_DIR, f"{name}.json")
+
+
+def save_results(report, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+
+
+def load_results(path):
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+# Names of benchmarks whose median call got slower than the threshold allows, printing each comparison
+def compare(baseline, current, threshold=REGRESSION_THRESHOLD):
+    regressions = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            print(f"{name:<24} (no baseline)")
+            continue
+        change = result["p50_us"] / base["p50_us"] - 1
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:<24} p50 {base['p50_us']:>10.1f} -> {result['p50_us']:>10.1f} us ({change * 100:+.1f}%){flag}")
+    return regressions
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "run"
+    name = sys.argv[2] if len(sys.argv) > 2 else "baseline"
+    if command == "run":
+        report = run_all()
+        save_results(report, baseline_path(name))
+        print(f"Saved {baseline_path(name)}")
+    elif command == "compare":
+        baseline = load_results(baseline_path(name))
+        current = load_results(baseline_path(sys.argv[3])) if len(sys.argv) > 3 else run_all()
+        print(f"\n--- Compared to {name} ({baseline['created']}, {baseline['machine']}) ---")
+        regressions = compare(baseline, current)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            sys.exit(1)
+        print("\nNo regressions")
+    else:
+        print("Usage: python wordleCore/benchmark.py run|compare [name] [other]")
+        sys.exit(2)
@@ -0,0 +1,63 @@
+# Compact candidate answer sets
+# A candidate set is a sorted array of column indices into the pattern table's answer list,
+# so filtering by (guess, feedback) is one vectorized comparison instead of a new string list.
+
+import numpy as np
+
+from wordleCore.pattern_matrix import get_pattern_table, pattern_to_code
+
+
+class CandidateSet:
+    def __init__(self, indices, table=None):
+        self.table = table or get_pattern_table()
+        self.indices = np.asarray(indices, dtype=np.intp)
+
+    # Every answer in the table
+    @classmethod
+    def all(cls, table=None):
+        table = table or get_pattern_table()
+        return cls(np.arange(len(table.answers)), table)
+
+    @classmethod
+    def from_words(cls, words, table=None):
+        table = table or get_pattern_table()
+        return cls(np.unique([table.answer_index[w] for w in words]), table)
+
+    # Answers that would have given this feedback (g/y/. string or pattern code) for the guess
+    def filter(self, guess, feedback):
+        code = pattern_to_code(feedback) if isinstance(feedback, str) else feedback
+        row = self.table.row(guess)
+        return CandidateSet(self.indices[row[self.indices] == code], self.table)
+
+    def __and__(self, other):
+        return CandidateSet(np.intersect1d(self.indices, other.indices, assume_unique=True), self.table)
+
+    def words(self):
+        answers = self.table.answers
+        return [answers[i] for i in self.indices]
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __iter__(self):
+        answers = self.table.answers
+        return (answers[i] for i in self.indices)
+
+    def __getitem__(self, position):
+        answers = self.table.answers
+        if isinstance(position, slice):
+            return [answers[i] for i in self.indices[position]]
+        return answers[self.indices[position]]
+
+    def __contains__(self, word):
+        index = self.table.answer_index.get(word)
+        if index is None:
+            return False
+        pos = np.searchsorted(self.indices, index)
+        return pos < len(self.indices) and self.indices[pos] == index
+
+    def __eq__(self, other):
+        return isinstance(other, CandidateSet) and np.array_equal(self.indices, other.indices)
+
+    def __repr__(self):
+        return repr(self.words())
@@ -0,0 +1,171 @@
+# Compiled decision trees
+# Walks a solver from the full answer list through every feedback path and stores the resulting
+# strategy as a flat tree (one guess per node, children keyed by pattern code) in an .npz file.
+# The runtime answers "next guess given history" in O(depth) and reports the exact guess-count
+# distribution over every answer without playing any games.
+#
+# Usage: python wordleCore/decision_tree.py entropyAlgo [policy]   (or entropyAlgoV2; policy defaults to entropy)
+
+import importlib
+import json
+import os
+import sys
+from collections import deque
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wordleCore.candidate_set import CandidateSet
+from wordleCore.pattern_matrix import (ALL_GREEN, CACHE_DIR, code_to_pattern, get_pattern_table,
+                                       pattern_to_code, words_fingerprint)
+from wordleCore.storage import atomic_write
+
+TREE_VERSION = 1  # bump when guess selection changes so stale trees are ignored
+MAX_GUESSES = 6
+SOLVED = -1  # child of a node whose guess was the answer
+GAVE_UP = -2  # child left unsolved after MAX_GUESSES guesses
+
+
+class DecisionTree:
+    def __init__(self, table, guess, child_start, child_code, child_node, child_size, name=""):
+        self.table = table
+        self.name = name
+        self.guess = guess  # node -> guess row in the pattern table
+        self.child_start = child_start  # node -> first child entry (CSR layout)
+        self.child_code = child_code  # entry -> pattern code, sorted within each node
+        self.child_node = child_node  # entry -> child node, SOLVED or GAVE_UP
+        self.child_size = child_size  # entry -> number of answers down this branch
+
+    def __len__(self):
+        return len(self.guess)
+
+    def guess_word(self, node):
+        return self.table.guesses[self.guess[node]]
+
+    def _child(self, node, code):
+        start, end = self.child_start[node], self.child_start[node + 1]
+        pos = start + np.searchsorted(self.child_code[start:end], code)
+        if pos < end and self.child_code[pos] == code:
+            return int(self.child_node[pos])
+        return None
+
+    # Node reached by the (guess, feedback) history, or None if it leaves the tree
+    def node_for(self, history):
+        node = 0
+        for guess, feedback in history:
+            if self.guess_word(node) != guess:
+                return None
+            code = pattern_to_code(feedback) if isinstance(feedback, str) else feedback
+            node = self._child(node, code)
+            if node is None or node < 0:
+                return None
+        return node
+
+    def next_guess(self, history):
+        node = self.node_for(history)
+        return None if node is None else self.guess_word(node)
+
+    # Tally of guesses needed per answer, in the wordle_stats.txt format
+    def distribution(self):
+        tally = {str(i): 0 for i in range(1, MAX_GUESSES + 1)}
+        tally["failed"] = 0
+        depth = np.zeros(len(self.guess), dtype=np.int32)
+        for node in range(len(self.guess)):  # children always come after their parent
+            for pos in range(self.child_start[node], self.child_start[node + 1]):
+                child = self.child_node[pos]
+                if child == SOLVED:
+                    tally[str(depth[node] + 1)] += 1
+                elif child == GAVE_UP:
+                    tally["failed"] += int(self.child_size[pos])
+                else:
+                    depth[child] = depth[node] + 1
+        return tally
+
+
+# Build the tree by asking select_fn(candidates, history) for the guess at every state.
+# A state with one candidate left guesses it, like the simulators do.
+def compile_decision_tree(select_fn, name="", table=None, max_guesses=MAX_GUESSES):
+    table = table or get_pattern_table()
+    guess, child_start, child_code, child_node, child_size = [], [0], [], [], []
+    queue = deque([(CandidateSet.all(table), [])])
+    next_node = 1
+    while queue:
+        candidates, history = queue.popleft()
+        word = candidates[0] if len(candidates) == 1 else select_fn(candidates, history)
+        guess.append(table.guess_index[word])
+        codes, sizes = np.unique(table.row(word)[candidates.indices], return_counts=True)
+        for code, size in zip(codes, sizes):
+            if code == ALL_GREEN:
+                child = SOLVED
+            elif len(history) + 1 >= max_guesses:
+                child = GAVE_UP
+            else:
+                child = next_node
+                next_node += 1
+                queue.append((candidates.filter(word, int(code)), history + [(word, code_to_pattern(code))]))
+            child_code.append(code)
+            child_node.append(child)
+            child_size.append(size)
+        child_start.append(len(child_code))
+    return DecisionTree(
+        table,
+        np.array(guess, dtype=np.uint16),
+        np.array(child_start, dtype=np.int32),
+        np.array(child_code, dtype=np.uint8),
+        np.array(child_node, dtype=np.int32),
+        np.array(child_size, dtype=np.int32),
+        name,
+    )
+
+
+# code_key identifies the code that picked the guesses (outcome_cache.code_fingerprint of the
+# solver's modules), so a tree compiled before a change to guess selection is never followed
+def tree_path(name, guess_pool, table, code_key):
+    return os.path.join(CACHE_DIR, f"decision_tree_{name}_{words_fingerprint(guess_pool, table.answers)}_{code_key}.npz")
+
+
+def save_decision_tree(tree, path):
+    meta = json.dumps({"version": TREE_VERSION, "name": tree.name})
+    with atomic_write(path) as f:
+        np.savez_compressed(f, meta=np.array(meta), guess=tree.guess, child_start=tree.child_start,
+                            child_code=tree.child_code, child_node=tree.child_node, child_size=tree.child_size)
+
+
+# Compiled tree for the solver, or None if it has not been compiled (or is outdated)
+def load_decision_tree(name, guess_pool, code_key, table=None):
+    table = table or get_pattern_table()
+    path = tree_path(name, guess_pool, table, code_key)
+    try:
+        with np.load(path) as data:
+            meta = json.loads(str(data["meta"]))
+            if meta["version"] != TREE_VERSION:
+                return None
+            return DecisionTree(table, data["guess"], data["child_start"], data["child_code"],
+                                data["child_node"], data["child_size"], meta["name"])
+    except (FileNotFoundError, ValueError, KeyError):
+        return None
+
+
+def print_distribution(tally):
+    total = sum(tally.values())
+    for n in range(1, MAX_GUESSES + 1):
+        print(f"Solved in {n} guesses: {tally[str(n)]} answers | {tally[str(n)] / total * 100:.2f}%")
+    print(f"Failed: {tally['failed']} answers | {tally['failed'] / total * 100:.2f}%")
+    solved = total - tally["failed"]
+    if solved:
+        mean = sum(n * tally[str(n)] for n in range(1, MAX_GUESSES + 1)) / solved
+        print(f"Average guesses when solved: {mean:.4f}")
+
+
+if __name__ == "__main__":
+    solver_dir = sys.argv[1] if len(sys.argv) > 1 else "entropyAlgo"
+    sys.path.insert(0, os.path.abspath(solver_dir))
+    solver = importlib.import_module("entropy_wordleai")
+    solver.USE_DECISION_TREE = False  # compile from the live solver, not an older tree
+    if len(sys.argv) > 2:
+        solver.SCORING_POLICY = sys.argv[2]
+    tree = compile_decision_tree(solver.next_guess, solver.solver_key())
+    path = tree_path(solver.solver_key(), solver.GUESS_POOL, tree.table, solver.code_key())
+    save_decision_tree(tree, path)
+    print(f"Compiled {len(tree)} nodes to {path}")
+    print_distribution(tree.distribution())
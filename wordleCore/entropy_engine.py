@@ -0,0 +1,260 @@
+# Vectorized guess scoring
+# Scores every guess against the current candidates in one batched pass over the pattern matrix,
+# using per-row histograms of pattern codes instead of a defaultdict per guess. Every criterion
+# (entropy, expected remaining candidates, worst bucket, chance of guessing the answer) is read
+# off the same histogram, and a scoring policy combines them into one score per guess.
+
+from functools import cached_property
+import math
+import re
+
+import numpy as np
+
+from wordleCore.candidate_set import CandidateSet
+from wordleCore.hard_mode import GuessPool
+from wordleCore.pattern_matrix import get_pattern_table
+
+NUM_PATTERNS = 243
+ALL_GREEN = NUM_PATTERNS - 1
+CHUNK_ROWS = 2048  # guess rows histogrammed per bincount call, bounds temporary memory
+TIE_TOLERANCE = 1e-9
+SORT_THRESHOLD = 48  # candidate sets up to this size are scored by sorting instead of bincount
+
+
+# Answer column indices for a CandidateSet or a list of candidate words
+def answer_indices(candidates, table=None):
+    if isinstance(candidates, CandidateSet):
+        return candidates.indices
+    table = table or get_pattern_table()
+    return np.fromiter((table.answer_index[w] for w in candidates), dtype=np.intp, count=len(candidates))
+
+
+# Guess row indices for a GuessPool or a list of guess words
+def guess_indices(guesses, table=None):
+    table = table or get_pattern_table()
+    if isinstance(guesses, GuessPool) and guesses.words_list is table.guesses:
+        return guesses.indices
+    return np.fromiter((table.guess_index[w] for w in guesses), dtype=np.intp, count=len(guesses))
+
+
+# Pattern codes of the guess rows against the answer columns, gathering only the needed cells
+def pattern_block(answer_idx, rows, table):
+    matrix = table.matrix
+    if len(answer_idx) == matrix.shape[1]:
+        return matrix[rows]
+    return matrix[np.ix_(rows, answer_idx)]
+
+
+# Bucket sizes of every pattern code for each guess row: shape (len(guess_rows), 243)
+def pattern_histograms(answer_idx, guess_rows=None, table=None):
+    table = table or get_pattern_table()
+    if guess_rows is None:
+        guess_rows = np.arange(table.matrix.shape[0])
+    counts = np.empty((len(guess_rows), NUM_PATTERNS), dtype=np.int64)
+    for start in range(0, len(guess_rows), CHUNK_ROWS):
+        rows = guess_rows[start:start + CHUNK_ROWS]
+        block = pattern_block(answer_idx, rows, table)
+        # Offset each row into its own block of 243 bins so one bincount histograms every row
+        offsets = (np.arange(len(rows)) * NUM_PATTERNS)[:, None]
+        flat = (block.astype(np.int64) + offsets).ravel()
+        counts[start:start + len(rows)] = np.bincount(
+            flat, minlength=len(rows) * NUM_PATTERNS
+        ).reshape(len(rows), NUM_PATTERNS)
+    return counts
+
+
+# Shannon entropy of each histogram row
+def entropies_from_histograms(counts, total):
+    if total == 0:
+        return np.zeros(len(counts))
+    p = counts / total
+    with np.errstate(divide='ignore', invalid='ignore'):
+        terms = np.where(counts > 0, p * np.log2(p), 0.0)
+    return -terms.sum(axis=1)
+
+
+# Bucket statistics of each guess row from its 243-bin histogram, each computed on first use
+class HistogramStats:
+    def __init__(self, counts, total):
+        self.counts = counts
+        self.total = total
+
+    @cached_property
+    def entropy(self):
+        return entropies_from_histograms(self.counts, self.total)
+
+    # Expected number of candidates left after the guess: sum of squared bucket sizes / total
+    @cached_property
+    def expected_remaining(self):
+        if self.total == 0:
+            return np.zeros(len(self.counts))
+        return (self.counts * self.counts).sum(axis=1) / self.total
+
+    @cached_property
+    def worst_bucket(self):
+        return self.counts.max(axis=1)
+
+    # Chance that the guess is the answer (candidates are equally likely)
+    @cached_property
+    def answer_probability(self):
+        if self.total == 0:
+            return np.zeros(len(self.counts))
+        return self.counts[:, ALL_GREEN] / self.total
+
+
+# Bucket statistics of each row of pattern codes without a 243-bin histogram, for small candidate
+# sets. After sorting a row, k is the position of each code within its run of equal codes, so the
+# k-th copy adds k*log2(k) - (k-1)*log2(k-1) to sum(c * log2(c)) and 2k - 1 to sum(c * c) over
+# the bucket sizes c, and the largest k is the worst bucket.
+class SortedStats:
+    def __init__(self, block):
+        rows, n = block.shape
+        self.total = n
+        self.ordered = np.sort(block, axis=1)
+        positions = np.broadcast_to(np.arange(n), (rows, n))
+        run_start = np.zeros((rows, n), dtype=np.intp)
+        run_start[:, 1:] = np.where(self.ordered[:, 1:] != self.ordered[:, :-1], positions[:, 1:], 0)
+        np.maximum.accumulate(run_start, axis=1, out=run_start)
+        self.k = positions - run_start + 1
+
+    @cached_property
+    def entropy(self):
+        n = self.total
+        if n == 0:
+            return np.zeros(len(self.k))
+        ks = np.arange(n + 1, dtype=np.float64)
+        klogk = np.zeros(n + 1)
+        klogk[1:] = ks[1:] * np.log2(ks[1:])
+        increments = np.diff(klogk, prepend=0.0)
+        return math.log2(n) - increments[self.k].sum(axis=1) / n
+
+    @cached_property
+    def expected_remaining(self):
+        if self.total == 0:
+            return np.zeros(len(self.k))
+        return (2 * self.k - 1).sum(axis=1) / self.total
+
+    @cached_property
+    def worst_bucket(self):
+        if self.total == 0:
+            return np.zeros(len(self.k), dtype=np.intp)
+        return self.k.max(axis=1)
+
+    # The all-green code sorts last, so a row holds the guess as a candidate iff it ends in it
+    @cached_property
+    def answer_probability(self):
+        if self.total == 0:
+            return np.zeros(len(self.k))
+        return (self.ordered[:, -1] == ALL_GREEN) / self.total
+
+
+# Entropy of each row of pattern codes without a 243-bin histogram
+def entropies_by_sorting(block):
+    return SortedStats(block).entropy
+
+
+# Bucket statistics of the guess rows (at most CHUNK_ROWS) against the candidate answer columns
+def bucket_stats(answer_idx, rows, table):
+    if len(answer_idx) <= SORT_THRESHOLD:
+        return SortedStats(pattern_block(answer_idx, rows, table))
+    return HistogramStats(pattern_histograms(answer_idx, rows, table), len(answer_idx))
+
+
+# Scoring policies map bucket statistics to one score per guess, higher is better. Only the
+# statistics a policy reads are computed.
+ANSWER_BONUS_BITS = 1.0  # bits credited for certainly guessing the answer (scaled by its probability)
+
+
+# Most information (the default)
+def entropy_score(stats):
+    return stats.entropy
+
+
+# Fewest candidates left on average
+def expected_remaining_score(stats):
+    return -stats.expected_remaining
+
+
+# Knuth's minimax: smallest worst-case bucket, preferring guesses that could be the answer on ties
+def minimax_score(stats):
+    return -stats.worst_bucket + 0.5 * (stats.answer_probability > 0)
+
+
+# Entropy plus a bonus for the chance of solving on this guess
+def entropy_answer_bonus_score(stats):
+    return stats.entropy + ANSWER_BONUS_BITS * stats.answer_probability
+
+
+SCORING_POLICIES = {
+    "entropy": entropy_score,
+    "expected_remaining": expected_remaining_score,
+    "minimax": minimax_score,
+    "entropy_answer_bonus": entropy_answer_bonus_score,
+}
+POLICY_NAME_PATTERN = re.compile(r"[A-Za-z0-9_.-]+")  # characters allowed in cache file names
+
+
+# Policy function for a name in SCORING_POLICIES, a function of bucket statistics, or None (entropy)
+def scoring_policy(policy=None):
+    if policy is None:
+        return entropy_score
+    if callable(policy):
+        return policy
+    if policy not in SCORING_POLICIES:
+        raise ValueError(f"Unknown scoring policy {policy!r}, expected one of {', '.join(SCORING_POLICIES)}")
+    return SCORING_POLICIES[policy]
+
+
+# Filename-safe name of a policy, used to key caches, opening books and trees: the registered name,
+# or a function's __qualname__ (lambdas and nested functions have none, so register them instead)
+def policy_name(policy=None):
+    if policy is None:
+        return "entropy"
+    if not callable(policy):
+        scoring_policy(policy)
+        return policy
+    for name, registered in SCORING_POLICIES.items():
+        if registered is policy:
+            return name
+    name = getattr(policy, "__qualname__", "")
+    if not POLICY_NAME_PATTERN.fullmatch(name):
+        raise ValueError(f"Scoring policy {policy!r} has no filename-safe name, add it to SCORING_POLICIES")
+    return name
+
+
+# Policy score (entropy by default) of every guess row against the candidate answer columns
+def score_guesses(answer_idx, guess_rows=None, table=None, policy=None):
+    table = table or get_pattern_table()
+    score = scoring_policy(policy)
+    if guess_rows is None:
+        guess_rows = np.arange(table.matrix.shape[0])
+    scores = np.empty(len(guess_rows))
+    for start in range(0, len(guess_rows), CHUNK_ROWS):
+        rows = guess_rows[start:start + CHUNK_ROWS]
+        scores[start:start + len(rows)] = score(bucket_stats(answer_idx, rows, table))
+    return scores
+
+
+# Position of the best score, taking the earliest guess on (floating point) ties
+def best_index(scores):
+    best = scores.max()
+    return int(np.flatnonzero(scores >= best - TIE_TOLERANCE)[0])
+
+
+# Best guess word for the candidates, drawn from guesses (defaults to every guess in the table)
+def select_best_guess(candidates, guesses=None, table=None, policy=None):
+    table = table or get_pattern_table()
+    guess_rows = None if guesses is None else guess_indices(guesses, table)
+    scores = score_guesses(answer_indices(candidates, table), guess_rows, table, policy)
+    best = best_index(scores)
+    return table.guesses[best] if guess_rows is None else guesses[best]
+
+
+# Top k (guess, score) pairs by the policy (entropy by default), best first
+def rank_guesses(candidates, guesses=None, k=5, table=None, policy=None):
+    table = table or get_pattern_table()
+    if guesses is None:
+        guesses = table.guesses
+    scores = score_guesses(answer_indices(candidates, table), guess_indices(guesses, table), table, policy)
+    order = np.argsort(-scores, kind='stable')[:k]
+    return [(guesses[i], float(scores[i])) for i in order]
@@ -0,0 +1,110 @@
+# Entropy solver plumbing shared by entropyAlgo and entropyAlgoV2
+# Guess selection order (compiled decision tree, then opening book, then a cached live search),
+# hard mode pools and candidate filtering live here once; each entropy_wordleai.py only supplies
+# its settings and, optionally, its own search.
+#
+# Settings (SOLVER_NAME, SCORING_POLICY, GUESS_POOL, OPENING_BOOK_DEPTH, USE_DECISION_TREE,
+# HARD_MODE) are read from the settings object, normally the solver module itself, on every call,
+# so editing the constants at the top of entropy_wordleai.py or setting them from a script keeps
+# working. The guess cache, opening book and tree are loaded lazily per solver key.
+
+import inspect
+import sys
+
+from wordleCore import entropy_engine
+from wordleCore.candidate_set import CandidateSet
+from wordleCore.decision_tree import load_decision_tree
+from wordleCore.guess_cache import GuessCache
+from wordleCore.hard_mode import GuessPool
+from wordleCore.opening_book import load_opening_book
+from wordleCore.outcome_cache import code_fingerprint
+from wordleCore.pattern_matrix import get_pattern_table, pattern_to_code
+
+
+# Best guess for the candidates from guesses under the scoring policy, in one batched pass
+def entropy_search(candidates, guesses, policy):
+    return entropy_engine.select_best_guess(candidates, guesses, policy=policy)
+
+
+class EntropySolver:
+    # search(candidates, guesses, policy) picks the live guess, entropy_search by default
+    def __init__(self, settings, search=entropy_search):
+        self.settings = settings
+        self.search = search
+        self.guess_caches = {}
+        self.opening_books = {}
+        self.decision_trees = {}
+
+    # Name of the cached guesses, opening book and decision tree for the scoring policy
+    def solver_key(self):
+        name = entropy_engine.policy_name(self.settings.SCORING_POLICY)
+        return self.settings.SOLVER_NAME if name == "entropy" else f"{self.settings.SOLVER_NAME}-{name}"
+
+    # Fingerprint of the code that picks guesses (the solver module, this module, the scoring
+    # engine, the search and the module of a callable scoring policy), part of the guess cache's,
+    # opening book's and decision tree's keys
+    def code_key(self):
+        sources = [self.settings, sys.modules[__name__], entropy_engine, self.search]
+        policy = self.settings.SCORING_POLICY
+        if callable(policy):
+            sources.append(inspect.getmodule(policy) or policy)
+        return code_fingerprint(sources)
+
+    def get_guess_cache(self):
+        key = self.solver_key()
+        if key not in self.guess_caches:
+            self.guess_caches[key] = GuessCache(key, self.settings.GUESS_POOL, self.code_key())
+        return self.guess_caches[key]
+
+    # Live search over the whole guess pool; repeated candidate sets hit the cache
+    def select_best_guess(self, candidates):
+        s = self.settings
+        return self.get_guess_cache().get_or_compute(
+            candidates, lambda c: self.search(c, s.GUESS_POOL, s.SCORING_POLICY))
+
+    def get_opening_book(self):
+        key = self.solver_key()
+        if key not in self.opening_books:
+            self.opening_books[key] = load_opening_book(key, self.select_best_guess, self.settings.GUESS_POOL,
+                                                        self.settings.OPENING_BOOK_DEPTH, self.code_key())
+        return self.opening_books[key]
+
+    # Compiled tree for this solver, or None if it has not been compiled
+    def get_decision_tree(self):
+        key = self.solver_key()
+        if key not in self.decision_trees:
+            self.decision_trees[key] = load_decision_tree(key, self.settings.GUESS_POOL, self.code_key())
+        return self.decision_trees[key]
+
+    # Guess pool for a new game: every allowed guess in hard mode, None (no restriction) otherwise
+    def initial_guess_pool(self):
+        return GuessPool(self.settings.GUESS_POOL) if self.settings.HARD_MODE else None
+
+    # Next guess given the (guess, feedback) history: compiled tree, then opening book, then live search.
+    # In hard mode pool is the GuessPool still allowed; the tree, book and cache assume every guess is
+    # allowed, so past the opening guess it searches the pool directly.
+    def next_guess(self, candidates, history, pool=None):
+        if pool is not None:
+            guess = self.get_opening_book().lookup(history) if not history else None
+            return guess or self.search(candidates, pool, self.settings.SCORING_POLICY)
+        tree = self.get_decision_tree() if self.settings.USE_DECISION_TREE else None
+        guess = tree.next_guess(history) if tree is not None else None
+        if guess is None:
+            guess = self.get_opening_book().lookup(history)
+        if guess is None:
+            guess = self.select_best_guess(candidates)
+        return guess
+
+
+# Filter candidates based on feedback
+def filter_words(candidates, guess, feedback):
+    if isinstance(candidates, CandidateSet):
+        return candidates.filter(guess, feedback)
+    table = get_pattern_table()
+    row = table.row(guess)
+    code = pattern_to_code(feedback)
+    filtered = []
+    for word in candidates:
+        if row[table.answer_index[word]] == code:
+            filtered.append(word)
+    return filtered
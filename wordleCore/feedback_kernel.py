@@ -0,0 +1,130 @@
+# Batched feedback kernel
+# Computes the pattern code of every guess against every answer in one vectorized pass, with
+# the same duplicate-letter rules as get_feedback: greens are matched first and consume their
+# answer letter, then yellows are assigned left to right while unmatched copies of the letter
+# remain in the answer. Codes are base-3 with position i weighted by 3**i (0 = '.', 1 = 'y',
+# 2 = 'g'), matching pattern_matrix.pattern_to_code.
+#
+# Usage: python wordleCore/feedback_kernel.py [pairs]   (cross-checks against the reference)
+
+import os
+import random
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wordleCore.vocabulary import LETTER_SHIFTS
+
+CHUNK_PAIRS = 1 << 20  # guess x answer pairs per vectorized block (~40 MB of temporaries)
+CHECK_PAIRS = 20000  # random pairs compared against the reference in check mode
+POSITION_WEIGHTS = np.array([1, 3, 9, 27, 81], dtype=np.uint8)
+
+
+# Reference feedback code of one guess against one answer (same rules as get_feedback)
+def feedback_code(guess, answer):
+    digits = [0] * 5
+    answer_chars = list(answer)
+    guess_chars = list(guess)
+    # First pass: greens
+    for i in range(5):
+        if guess_chars[i] == answer_chars[i]:
+            digits[i] = 2
+            answer_chars[i] = None
+            guess_chars[i] = None
+    # Second pass: yellows
+    for i in range(5):
+        if guess_chars[i] is not None and guess_chars[i] in answer_chars:
+            digits[i] = 1
+            answer_chars[answer_chars.index(guess_chars[i])] = None
+    return digits[0] + 3 * digits[1] + 9 * digits[2] + 27 * digits[3] + 81 * digits[4]
+
+
+# (n, 5) uint8 letter array from a list of words, packed uint32 words or an existing letter array
+def word_letters(words):
+    if isinstance(words, np.ndarray):
+        if words.ndim == 2:
+            return words.astype(np.uint8, copy=False)
+        return ((words.astype(np.uint32)[:, None] >> LETTER_SHIFTS) & 31).astype(np.uint8)
+    if not len(words):
+        return np.empty((0, 5), dtype=np.uint8)
+    return np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8).reshape(-1, 5) - ord('a')
+
+
+# Codes for a block of guesses (g, 5) against answers (a, 5), as a (g, a) uint8 array
+def _feedback_block(guess_letters, answer_letters):
+    g = guess_letters[:, None, :]  # (g, 1, 5)
+    a = answer_letters[None, :, :]  # (1, a, 5)
+    green = g == a  # (g, a, 5)
+    # same[i, j]: guess letter i equals answer letter j
+    same = g[:, :, :, None] == a[:, :, None, :]  # (g, a, 5, 5)
+    # Answer copies of guess letter i left over after the greens
+    unmatched = (same & ~green[:, :, None, :]).sum(axis=3, dtype=np.int8)  # (g, a, 5)
+    yellow = np.zeros_like(green)
+    for i in range(5):
+        # Earlier yellows on the same letter have already used up answer copies
+        used = np.zeros(green.shape[:2], dtype=np.int8)
+        for k in range(i):
+            used += yellow[:, :, k] & (guess_letters[:, k] == guess_letters[:, i])[:, None]
+        yellow[:, :, i] = ~green[:, :, i] & (unmatched[:, :, i] > used)
+    digits = green.view(np.uint8) * 2 + yellow.view(np.uint8)
+    return (digits * POSITION_WEIGHTS).sum(axis=2, dtype=np.uint8)
+
+
+# Pattern code of every guess against every answer, as a (len(guesses), len(answers)) uint8
+# matrix. guesses/answers are word lists, packed uint32 arrays or (n, 5) letter arrays.
+# check=True also compares a random sample of pairs (or all of them, if fewer) to feedback_code.
+def feedback_matrix(guesses, answers, check=False):
+    guess_letters = word_letters(guesses)
+    answer_letters = word_letters(answers)
+    codes = np.empty((len(guess_letters), len(answer_letters)), dtype=np.uint8)
+    rows = max(1, CHUNK_PAIRS // max(1, len(answer_letters)))
+    for start in range(0, len(guess_letters), rows):
+        codes[start:start + rows] = _feedback_block(guess_letters[start:start + rows], answer_letters)
+    if check:
+        mismatches = cross_check(guess_letters, answer_letters, codes)
+        if mismatches:
+            raise RuntimeError(f"feedback_matrix disagrees with feedback_code on {len(mismatches)} pairs, "
+                               f"e.g. {mismatches[:5]}")
+    return codes
+
+
+def _letters_to_word(letters):
+    return bytes(letters + ord('a')).decode("ascii")
+
+
+# (guess, answer, kernel code, reference code) for every checked pair that disagrees
+def cross_check(guesses, answers, codes, pairs=CHECK_PAIRS, seed=0):
+    guess_letters = word_letters(guesses)
+    answer_letters = word_letters(answers)
+    total = len(guess_letters) * len(answer_letters)
+    if total <= pairs:
+        checked = range(total)
+    else:
+        checked = random.Random(seed).sample(range(total), pairs)
+    mismatches = []
+    for flat in checked:
+        gi, ai = divmod(flat, len(answer_letters))
+        guess, answer = _letters_to_word(guess_letters[gi]), _letters_to_word(answer_letters[ai])
+        reference = feedback_code(guess, answer)
+        if codes[gi, ai] != reference:
+            mismatches.append((guess, answer, int(codes[gi, ai]), reference))
+    return mismatches
+
+
+if __name__ == "__main__":
+    import time
+    from wordleCore.vocabulary import get_answers, get_guesses
+    pairs = int(sys.argv[1]) if len(sys.argv) > 1 else CHECK_PAIRS
+    guesses, answers = get_guesses(), get_answers()
+    start = time.perf_counter()
+    codes = feedback_matrix(guesses, answers)
+    elapsed = time.perf_counter() - start
+    print(f"{codes.size} pairs in {elapsed:.2f}s ({codes.size / elapsed / 1e6:.1f}M pairs/s)")
+    mismatches = cross_check(guesses, answers, codes, pairs)
+    print(f"Cross-checked {min(pairs, codes.size)} pairs against feedback_code: {len(mismatches)} mismatches")
+    # Words with repeated letters are where the consumption rules matter most
+    repeats = [w for w in guesses if len(set(w)) < 5]
+    codes = feedback_matrix(repeats[:300], [w for w in answers if len(set(w)) < 5], check=True)
+    print(f"Repeated-letter block {codes.shape[0]} x {codes.shape[1]}: exhaustive check passed")
+    sys.exit(1 if mismatches else 0)
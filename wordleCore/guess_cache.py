@@ -0,0 +1,141 @@
+# Memoized best-guess cache
+# Maps a canonical hash of the candidate set (plus the solver configuration) to the chosen guess.
+# Entries are keyed by the solver's code key (see EntropySolver.code_key), so editing the scoring
+# or search code starts a fresh cache instead of replaying guesses the old code picked.
+# Lookups go through an in-memory LRU first and, optionally, an SQLite file under
+# wordleCore/cache/ so later runs start warm. Safe to share between threads (the automation
+# scripts fill it from a background speculation worker). The file is opened in WAL mode so
+# parallel simulation workers can write at once, and new entries are committed in batches (at
+# every simulation chunk checkpoint and at exit) rather than one transaction per guess.
+
+import atexit
+import hashlib
+import os
+import threading
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+
+from wordleCore.candidate_set import CandidateSet
+from wordleCore.pattern_matrix import CACHE_DIR, get_pattern_table, words_fingerprint
+from wordleCore.storage import connect_per_process
+
+DEFAULT_MAX_ENTRIES = 50000
+FLUSH_ROWS = 100  # buffered entries that trigger a commit
+SCHEMA = "CREATE TABLE IF NOT EXISTS guesses (key TEXT PRIMARY KEY, guess TEXT NOT NULL);"
+
+_open_caches = weakref.WeakSet()
+
+
+# Canonical fingerprint of a candidate set, independent of word order
+def candidates_key(candidates, table=None):
+    if isinstance(candidates, CandidateSet):
+        indices = candidates.indices
+    else:
+        table = table or get_pattern_table()
+        indices = np.sort([table.answer_index[w] for w in candidates])
+    return hashlib.blake2b(np.asarray(indices, dtype=np.int32).tobytes(), digest_size=16).hexdigest()
+
+
+class GuessCache:
+    def __init__(self, name, guess_pool, code_key, max_entries=DEFAULT_MAX_ENTRIES, on_disk=True, table=None):
+        self.table = table or get_pattern_table()
+        fingerprint = words_fingerprint(guess_pool, self.table.answers)
+        self.config = f"{name}:{fingerprint}:{code_key}"
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.path = None
+        self._lock = threading.RLock()
+        self.pending = []  # (key, guess) rows not yet committed
+        self._pending_pid = os.getpid()
+        if on_disk:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            self.path = os.path.join(CACHE_DIR, f"guess_cache_{name}_{fingerprint}_{code_key}.sqlite")
+            self._connection = connect_per_process(self.path, SCHEMA)
+            _open_caches.add(self)
+
+    # SQLite connection for this thread and process
+    @property
+    def db(self):
+        return None if self.path is None else self._connection()
+
+    def _remember(self, key, guess):
+        self.entries[key] = guess
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def get(self, candidates):
+        key = f"{self.config}:{candidates_key(candidates, self.table)}"
+        with self._lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+        db = self.db
+        if db is not None:
+            row = db.execute("SELECT guess FROM guesses WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                with self._lock:
+                    self.disk_hits += 1
+                    self._remember(key, row[0])
+                return row[0]
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, candidates, guess):
+        key = f"{self.config}:{candidates_key(candidates, self.table)}"
+        with self._lock:
+            self._remember(key, guess)
+            if self.path is None:
+                return
+            if self._pending_pid != os.getpid():  # rows buffered before a fork belong to the parent
+                self.pending = []
+                self._pending_pid = os.getpid()
+            self.pending.append((key, guess))
+            full = len(self.pending) >= FLUSH_ROWS
+        if full:
+            self.flush()
+
+    # Commit buffered entries in one transaction
+    def flush(self):
+        with self._lock:
+            if not self.pending or self._pending_pid != os.getpid():
+                return
+            rows, self.pending = self.pending, []
+        db = self.db
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            db.executemany("INSERT OR REPLACE INTO guesses (key, guess) VALUES (?, ?)", rows)
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+
+    # Cached guess for the candidates, calling compute(candidates) on a miss
+    def get_or_compute(self, candidates, compute):
+        guess = self.get(candidates)
+        if guess is None:
+            guess = compute(candidates)
+            self.put(candidates, guess)
+        return guess
+
+    def stats(self):
+        lookups = self.hits + self.disk_hits + self.misses
+        hit_rate = (self.hits + self.disk_hits) / lookups * 100 if lookups else 0.0
+        return (f"{self.hits} memory hits, {self.disk_hits} disk hits, {self.misses} misses "
+                f"({hit_rate:.2f}% hit rate, {len(self.entries)} entries in memory)")
+
+
+# Commit every guess cache this process has open (called at each simulation checkpoint and at exit)
+def flush_caches():
+    for cache in list(_open_caches):
+        cache.flush()
+
+
+atexit.register(flush_caches)
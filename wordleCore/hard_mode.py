@@ -0,0 +1,90 @@
+# Hard mode guess pools
+# Under NYT hard mode every revealed hint must be used: green letters stay in place and yellow
+# letters must appear in later guesses (as many copies as were revealed). A guess pool is a
+# sorted array of indices into a word list that only keeps guesses obeying every hint so far,
+# narrowed each turn instead of being rechecked against the whole history.
+#
+# A word x uses the hints of (guess, feedback) exactly when the feedback of guess against x
+# keeps every green of feedback green and marks at least as many copies of each guess letter
+# non-gray, so each turn is one batched feedback_matrix row over the pool.
+
+import numpy as np
+
+from wordleCore.feedback_kernel import feedback_matrix, word_letters
+from wordleCore.pattern_matrix import pattern_to_code
+
+POWERS_OF_3 = np.array([1, 3, 9, 27, 81], dtype=np.uint8)
+
+
+def code_digits(codes):
+    return (np.asarray(codes, dtype=np.uint8)[..., None] // POWERS_OF_3) % 3
+
+
+class GuessPool:
+    def __init__(self, words, indices=None, letters=None, word_index=None):
+        self.words_list = words  # every word the pool can hold, e.g. the solver's GUESS_POOL
+        self.letters = word_letters(words) if letters is None else letters
+        self.indices = np.arange(len(words)) if indices is None else np.asarray(indices, dtype=np.intp)
+        self._word_index = word_index  # word -> position in words_list, built on the first lookup
+
+    # Guesses still allowed after playing guess and seeing feedback (g/y/. string or pattern code)
+    def restrict(self, guess, feedback):
+        code = pattern_to_code(feedback) if isinstance(feedback, str) else feedback
+        revealed = code_digits(code)
+        guess_letters = word_letters([guess])[0]
+        seen = code_digits(feedback_matrix(guess_letters[None, :], self.letters[self.indices])[0])
+        keep = np.all(seen[:, revealed == 2] == 2, axis=1)
+        for letter in np.unique(guess_letters[revealed > 0]):
+            same = guess_letters == letter
+            keep &= (seen[:, same] > 0).sum(axis=1) >= (revealed[same] > 0).sum()
+        return GuessPool(self.words_list, self.indices[keep], self.letters, self._word_index)
+
+    # Boolean flag per word in words_list
+    def flags(self):
+        flags = np.zeros(len(self.words_list), dtype=bool)
+        flags[self.indices] = True
+        return flags
+
+    def words(self):
+        return [self.words_list[i] for i in self.indices]
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __iter__(self):
+        return (self.words_list[i] for i in self.indices)
+
+    # Position of every word in words_list, shared by the pools restricted from this one
+    @property
+    def word_index(self):
+        if self._word_index is None:
+            self._word_index = {w: i for i, w in enumerate(self.words_list)}
+        return self._word_index
+
+    def __contains__(self, word):
+        index = self.word_index.get(word)
+        if index is None:
+            return False
+        pos = np.searchsorted(self.indices, index)
+        return pos < len(self.indices) and self.indices[pos] == index
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self.words_list[i] for i in self.indices[position]]
+        return self.words_list[self.indices[position]]
+
+    def __repr__(self):
+        return repr(self.words())
+
+
+# Pool after one more turn, or None when not playing hard mode
+def update_guess_pool(pool, guess, feedback):
+    return None if pool is None else pool.restrict(guess, feedback)
+
+
+# Whether guess uses every hint in the (guess, feedback) history
+def allowed_in_hard_mode(guess, history):
+    pool = GuessPool([guess])
+    for played, feedback in history:
+        pool = pool.restrict(played, feedback)
+    return len(pool) == 1
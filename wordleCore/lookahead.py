@@ -0,0 +1,359 @@
+# Pruned 2-ply lookahead
+# The 2-ply value of a first guess is its own entropy plus the expected entropy of the best second
+# guess inside each of its feedback buckets, i.e. the information expected from two guesses.
+# First guesses are visited in 1-ply entropy order. A guess is skipped, or abandoned part way,
+# once its upper bound (entropy so far + sum of p * log2(min(bucket size, 243)) for the buckets
+# left) cannot beat the best value found, so pruning never changes the exhaustive result.
+# Ties go to the guess ranked higher by 1-ply entropy (then list order), so among equally
+# informative plans the one that learns more on the first guess wins.
+# Optional beams keep only the top first/second guesses by 1-ply entropy. The search can keep a
+# top k instead of a single best and spread first guesses across a process pool whose workers
+# read the candidate arrays from shared memory and the pattern matrix from its shared mmap.
+
+import hashlib
+import math
+import multiprocessing
+import os
+from collections import OrderedDict
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from wordleCore import entropy_engine
+from wordleCore.entropy_engine import NUM_PATTERNS, TIE_TOLERANCE
+from wordleCore.pattern_matrix import get_pattern_table
+from wordleCore.telemetry import Progress
+
+MEMO_BUDGET_BYTES = 64 * 2 ** 20  # one budget for every second-guess pool and search in this process
+MEMO_ENTRY_OVERHEAD = 160  # approximate bytes of dict slot, key object and value tuple
+
+
+# Most entropy any second guess can get out of a bucket of this size
+def bucket_upper_bound(size):
+    return math.log2(min(size, NUM_PATTERNS)) if size > 1 else 0.0
+
+
+# Best follow-up per (second-guess pool, answer subset), shared by every first guess (and later
+# search) that splits the candidates into the same subset. Keys are a pool fingerprint followed by
+# the raw sorted answer indices, so lookups are exact; entries are charged their key size and
+# evicted least recently used past the budget, whichever pool they belong to.
+class SubsetMemo:
+    def __init__(self, budget_bytes=MEMO_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self.entries = OrderedDict()  # key -> (best entropy, best second guess row, bucket count)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        if key in self.entries:
+            return
+        self.entries[key] = value
+        self.used_bytes += len(key) + MEMO_ENTRY_OVERHEAD
+        while self.used_bytes > self.budget_bytes and self.entries:
+            old_key, _ = self.entries.popitem(last=False)
+            self.used_bytes -= len(old_key) + MEMO_ENTRY_OVERHEAD
+
+
+# The process-wide memo as seen by one second-guess pool (results depend on which guesses may follow)
+class PoolMemo:
+    def __init__(self, memo, pool_key):
+        self.memo = memo
+        self.pool_key = pool_key
+
+    def get(self, key):
+        return self.memo.get(self.pool_key + key)
+
+    def put(self, key, value):
+        self.memo.put(self.pool_key + key, value)
+
+    @property
+    def hits(self):
+        return self.memo.hits
+
+    @property
+    def misses(self):
+        return self.memo.misses
+
+
+_memo = SubsetMemo()
+
+
+def memo_for(second_rows):
+    pool_key = hashlib.blake2b(np.ascontiguousarray(second_rows).tobytes(), digest_size=16).digest()
+    return PoolMemo(_memo, pool_key)
+
+
+def subset_key(bucket_idx):
+    return np.asarray(bucket_idx, dtype=np.uint16).tobytes()
+
+
+# Entropy of the best second guess (from second_rows) within one bucket of answers
+def best_second_entropy(bucket_idx, second_rows, table, memo=None):
+    if len(bucket_idx) <= 1:
+        return 0.0
+    key = subset_key(bucket_idx) if memo is not None else None
+    if key is not None:
+        cached = memo.get(key)
+        if cached is not None:
+            return cached[0]
+    scores = entropy_engine.score_guesses(bucket_idx, second_rows, table)
+    best = entropy_engine.best_index(scores)
+    if key is not None:
+        row = second_rows[best]
+        buckets = len(np.unique(table.matrix[row, bucket_idx]))
+        memo.put(key, (float(scores[best]), int(row), buckets))
+    return float(scores[best])
+
+
+# Buckets of answer columns a guess row splits the candidates into, largest first
+def split_buckets(guess_row, answer_idx, table):
+    codes = table.matrix[guess_row, answer_idx]
+    order = np.argsort(codes, kind='stable')
+    _, starts, sizes = np.unique(codes[order], return_index=True, return_counts=True)
+    buckets = [answer_idx[order[start:start + size]] for start, size in zip(starts, sizes)]
+    buckets.sort(key=len, reverse=True)
+    return buckets
+
+
+# Per-guess 1-ply entropy and 2-ply upper bound over the candidates
+def first_ply_bounds(answer_idx, guess_rows, table):
+    total = len(answer_idx)
+    counts = entropy_engine.pattern_histograms(answer_idx, guess_rows, table)
+    entropies = entropy_engine.entropies_from_histograms(counts, total)
+    capped = np.log2(np.clip(counts, 1, NUM_PATTERNS))
+    upper = entropies + (counts * capped).sum(axis=1) / total
+    return entropies, upper
+
+
+# Running top-k of (value, 1-ply rank, guess position), ties going to the lower rank
+class TopK:
+    def __init__(self, k):
+        self.k = k
+        self.entries = []  # (pos, value, rank), best first
+
+    def full(self):
+        return len(self.entries) >= self.k
+
+    # (value, rank) a newcomer has to beat once k entries are kept, else None
+    def worst(self):
+        if not self.full():
+            return None
+        _, value, rank = self.entries[-1]
+        return value, rank
+
+    def offer(self, pos, rank, value):
+        if self.full() and not beats(value, rank, self.worst()):
+            return
+        at = len(self.entries)
+        while at > 0 and beats(value, rank, self.entries[at - 1][1:]):
+            at -= 1
+        self.entries.insert(at, (pos, float(value), rank))
+        del self.entries[self.k:]
+
+    # Entries as (pos, value, rank), best first
+    def ranked(self):
+        return list(self.entries)
+
+
+# Would a value at this 1-ply rank beat the (value, rank) threshold?
+def beats(value, rank, threshold):
+    if threshold is None:
+        return True
+    best_value, best_rank = threshold
+    if value > best_value + TIE_TOLERANCE:
+        return True
+    return value >= best_value - TIE_TOLERANCE and rank < best_rank
+
+
+class TwoPlySearch:
+    # shared_bound, when given, is a lock-protected [value, rank] array holding the best k-th
+    # entry found by any worker, so every worker prunes against the global threshold
+    def __init__(self, answer_idx, guess_rows, second_rows, table, k=1, prune=True, shared_bound=None):
+        self.answer_idx = answer_idx
+        self.guess_rows = guess_rows
+        self.second_rows = second_rows
+        self.table = table
+        self.prune = prune
+        self.top = TopK(k)
+        self.shared_bound = shared_bound
+        self.memo = memo_for(second_rows)
+        self.memo_hits = 0
+        self.memo_misses = 0
+        self.evaluated = 0
+        self.pruned = 0
+        self.abandoned = 0
+
+    # Weakest (value, rank) that can still make the top k, or None while it has free slots
+    def threshold(self):
+        local = self.top.worst()
+        if self.shared_bound is None or self.shared_bound[1] < 0:
+            return local
+        shared = (self.shared_bound[0], int(self.shared_bound[1]))
+        if local is None or beats(shared[0], shared[1], local):
+            return shared
+        return local
+
+    # Could the guess at this 1-ply rank with this upper bound still make the top k?
+    def can_beat(self, bound, rank):
+        return not self.prune or beats(bound, rank, self.threshold())
+
+    # 2-ply value of the first guess at pos, or None if its bound fell below the threshold
+    def evaluate(self, pos, rank, first_entropy, upper):
+        total = len(self.answer_idx)
+        value = first_entropy
+        remaining = upper - first_entropy
+        for bucket in split_buckets(self.guess_rows[pos], self.answer_idx, self.table):
+            p = len(bucket) / total
+            remaining -= p * bucket_upper_bound(len(bucket))
+            value += p * best_second_entropy(bucket, self.second_rows, self.table, self.memo)
+            if not self.can_beat(value + max(remaining, 0.0), rank):
+                return None
+        return value
+
+    def offer(self, pos, rank, value):
+        self.top.offer(pos, rank, value)
+        worst = self.top.worst()
+        if self.shared_bound is not None and worst is not None:
+            with self.shared_bound.get_lock():
+                if self.shared_bound[1] < 0 or beats(worst[0], worst[1], (self.shared_bound[0], self.shared_bound[1])):
+                    self.shared_bound[0], self.shared_bound[1] = worst
+
+    # Visit first guesses by 1-ply rank (order[rank] is a position in the guess list)
+    def run(self, ranks, order, entropies, upper, progress=None):
+        hits, misses = self.memo.hits, self.memo.misses
+        for rank in ranks:
+            if progress is not None:
+                progress.update()
+            pos = order[rank]
+            if not self.can_beat(upper[pos], rank):
+                self.pruned += 1
+                continue
+            self.evaluated += 1
+            value = self.evaluate(pos, rank, entropies[pos], upper[pos])
+            if value is None:
+                self.abandoned += 1
+            else:
+                self.offer(pos, rank, value)
+        self.memo_hits += self.memo.hits - hits
+        self.memo_misses += self.memo.misses - misses
+
+    def stats(self):
+        lookups = self.memo_hits + self.memo_misses
+        hit_rate = self.memo_hits / lookups * 100 if lookups else 0.0
+        return (f"{self.evaluated} first guesses evaluated ({self.abandoned} abandoned early), {self.pruned} pruned, "
+                f"subset memo {self.memo_hits}/{lookups} hits ({hit_rate:.1f}%)")
+
+
+# Numpy array copied into a new shared memory block, plus the (name, shape, dtype) to attach it
+def share_array(array):
+    array = np.ascontiguousarray(array)
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[:] = array
+    return shm, (shm.name, array.shape, array.dtype.str)
+
+
+def attach_array(spec):
+    name, shape, dtype = spec
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+_worker = {}
+
+
+def _init_worker(specs, shared_bound, k, prune):
+    arrays = {}
+    for key, spec in specs.items():
+        shm, arrays[key] = attach_array(spec)
+        _worker.setdefault("shm", []).append(shm)  # keep the mapping alive
+    _worker.update(arrays=arrays, shared_bound=shared_bound, k=k, prune=prune)
+
+
+# Search the first guesses at ranks start, start + step, ... and return the local top k
+def _search_ranks(task):
+    start, step = task
+    a = _worker["arrays"]
+    search = TwoPlySearch(a["answer_idx"], a["guess_rows"], a["second_rows"], get_pattern_table(),
+                          _worker["k"], _worker["prune"], _worker["shared_bound"])
+    search.run(range(start, len(a["order"]), step), a["order"], a["entropies"], a["upper"])
+    return search.top.ranked(), (search.evaluated, search.pruned, search.abandoned,
+                                 search.memo_hits, search.memo_misses)
+
+
+# Run the 2-ply search for the top k first guesses, serially or across a process pool
+def search_2ply(candidates, guesses=None, k=1, beam1=None, beam2=None, prune=True, workers=1, table=None):
+    table = table or get_pattern_table()
+    if guesses is None:
+        guesses = table.guesses
+    answer_idx = entropy_engine.answer_indices(candidates, table)
+    guess_rows = entropy_engine.guess_indices(guesses, table)
+    entropies, upper = first_ply_bounds(answer_idx, guess_rows, table)
+    order = np.argsort(-entropies, kind='stable')
+    second_rows = guess_rows if beam2 is None else guess_rows[np.sort(order[:beam2])]
+    if beam1 is not None:
+        order = order[:beam1]
+    search = TwoPlySearch(answer_idx, guess_rows, second_rows, table, k, prune)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(order) < 2 * workers:
+        search.run(range(len(order)), order, entropies, upper, Progress("first guesses", len(order)))
+        return search
+    arrays = {"answer_idx": answer_idx, "guess_rows": guess_rows, "second_rows": second_rows,
+              "order": order, "entropies": entropies, "upper": upper}
+    blocks, specs = [], {}
+    try:
+        for key, array in arrays.items():
+            shm, specs[key] = share_array(array)
+            blocks.append(shm)
+        ctx = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() \
+            else multiprocessing.get_context()
+        shared_bound = ctx.Array('d', [float('-inf'), -1.0])
+        # Interleave ranks so every worker starts on strong guesses and tightens the bound early
+        steps = workers * 4
+        progress = Progress("first guesses", len(order))
+        with ctx.Pool(workers, initializer=_init_worker, initargs=(specs, shared_bound, k, prune)) as pool:
+            for ranked, (evaluated, pruned, abandoned, memo_hits, memo_misses) in pool.imap_unordered(
+                    _search_ranks, [(start, steps) for start in range(steps)]):
+                for pos, value, rank in ranked:
+                    search.top.offer(pos, rank, value)
+                search.evaluated += evaluated
+                search.pruned += pruned
+                search.abandoned += abandoned
+                search.memo_hits += memo_hits
+                search.memo_misses += memo_misses
+                progress.update(evaluated + pruned)
+    finally:
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+    return search
+
+
+# Best first guess by 2-ply value, as (guess, value, search). guesses defaults to every guess
+# in the table; beam1/beam2 keep only that many first/second guesses by 1-ply entropy, and
+# prune=False evaluates every first guess in full (exhaustive search).
+def select_best_guess_2ply(candidates, guesses=None, beam1=None, beam2=None, prune=True, workers=1, table=None):
+    table = table or get_pattern_table()
+    if guesses is None:
+        guesses = table.guesses
+    search = search_2ply(candidates, guesses, 1, beam1, beam2, prune, workers, table)
+    pos, value, _ = search.top.ranked()[0]
+    return guesses[pos], value, search
+
+
+# Top k (guess, 2-ply value) pairs, best first, plus the search for its stats
+def rank_guesses_2ply(candidates, guesses=None, k=5, beam1=None, beam2=None, workers=None, table=None):
+    table = table or get_pattern_table()
+    if guesses is None:
+        guesses = table.guesses
+    search = search_2ply(candidates, guesses, k, beam1, beam2, True, workers, table)
+    return [(guesses[pos], value) for pos, value, _ in search.top.ranked()], search
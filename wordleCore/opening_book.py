@@ -0,0 +1,88 @@
+# Opening book
+# Precomputes a solver's guess for every feedback path over the first few turns so games can
+# skip live search early on. Books are saved as JSON under wordleCore/cache/, one per solver,
+# keyed by the word lists and the solver's code key (see EntropySolver.code_key), and rebuilt
+# automatically when either changes or a deeper book is requested.
+
+import json
+import os
+
+import numpy as np
+
+from wordleCore.candidate_set import CandidateSet
+from wordleCore.pattern_matrix import ALL_GREEN, CACHE_DIR, code_to_pattern, get_pattern_table, words_fingerprint
+from wordleCore.storage import atomic_write
+
+# Book key for a feedback path, e.g. "" for turn one, "..g../.y..." for turn three
+def path_key(feedbacks):
+    return "/".join(feedbacks)
+
+
+class OpeningBook:
+    def __init__(self, name, depth, entries):
+        self.name = name
+        self.depth = depth
+        self.entries = entries  # path_key -> guess
+
+    # Book guess for the game so far, or None once the history leaves the book.
+    # history is a list of (guess, feedback) pairs already played.
+    def lookup(self, history):
+        if len(history) >= self.depth:
+            return None
+        feedbacks = []
+        for guess, feedback in history:
+            if self.entries.get(path_key(feedbacks)) != guess:
+                return None  # the player deviated from the book
+            feedbacks.append(feedback)
+        return self.entries.get(path_key(feedbacks))
+
+    def __len__(self):
+        return len(self.entries)
+
+
+# Walk every feedback path from the full answer list, recording select_fn's guess for each
+# state with more than one candidate left
+def build_opening_book(name, select_fn, depth, table=None):
+    table = table or get_pattern_table()
+    entries = {}
+    frontier = [([], CandidateSet.all(table))]
+    for _ in range(depth):
+        next_frontier = []
+        for feedbacks, candidates in frontier:
+            if len(candidates) <= 1:
+                continue
+            guess = select_fn(candidates)
+            entries[path_key(feedbacks)] = guess
+            for code in np.unique(table.row(guess)[candidates.indices]):
+                if code == ALL_GREEN:
+                    continue
+                next_frontier.append((feedbacks + [code_to_pattern(code)], candidates.filter(guess, int(code))))
+        frontier = next_frontier
+    return OpeningBook(name, depth, entries)
+
+
+def book_path(name, guess_pool, table, code_key):
+    fingerprint = words_fingerprint(guess_pool, table.answers)
+    return os.path.join(CACHE_DIR, f"opening_book_{name}_{fingerprint}_{code_key}.json")
+
+
+def save_opening_book(book, path):
+    with atomic_write(path, "w") as f:
+        json.dump({"name": book.name, "depth": book.depth, "entries": book.entries}, f)
+
+
+# Load the solver's book, (re)building it when missing or too shallow
+def load_opening_book(name, select_fn, guess_pool, depth, code_key, table=None):
+    table = table or get_pattern_table()
+    path = book_path(name, guess_pool, table, code_key)
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+        if data["depth"] >= depth:
+            return OpeningBook(name, depth, data["entries"])
+    except (FileNotFoundError, ValueError, KeyError):
+        pass
+    print(f"Building {name} opening book (depth {depth}), this only happens once...")
+    book = build_opening_book(name, select_fn, depth, table)
+    save_opening_book(book, path)
+    return book
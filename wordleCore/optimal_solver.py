@@ -0,0 +1,270 @@
+# Exact optimal solver
+# Finds the strategy with the fewest expected guesses (total guesses over every answer divided by
+# the number of answers), optionally never using more than MAX_GUESSES, by depth-first branch and
+# bound over candidate sets.
+#
+# cost(S) is the total number of guesses needed to solve every answer in the candidate set S: a
+# guess costs 1 for each answer in S, plus the cost of each feedback bucket other than all-green.
+# The lower bound of a guess is |S| plus the cheapest conceivable cost of each bucket (one answer
+# solved by the next guess, at most 242**(d-1) by the d-th after it). A guess is only expanded
+# while its bound is below the best cost found, and its buckets are abandoned as soon as the
+# running total reaches it, so pruning never changes the result. Guesses are tried in bound
+# order (candidates first on ties), at most GUESS_CAP per node: with GUESS_CAP = None the search
+# is exact over the whole guess pool, otherwise it is optimal over the guesses it considers.
+#
+# Solved states go into a transposition table keyed by the sorted answer indices and the guesses
+# left. It is checkpointed to an SQLite file under wordleCore/cache/, so an interrupted search
+# picks up every subtree it already finished.
+#
+# Usage: python wordleCore/optimal_solver.py [first guess|-] [guess cap|none] [answers|guesses]
+#   solves below the first guess (or searches it too with -), over the answers (default) or
+#   every valid guess, then compiles the optimal decision tree and prints its distribution.
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wordleCore.candidate_set import CandidateSet
+from wordleCore.decision_tree import compile_decision_tree, print_distribution, save_decision_tree, tree_path
+from wordleCore.entropy_engine import NUM_PATTERNS, SORT_THRESHOLD, pattern_block, pattern_histograms
+from wordleCore.outcome_cache import code_fingerprint
+from wordleCore.pattern_matrix import ALL_GREEN, CACHE_DIR, get_pattern_table, words_fingerprint
+from wordleCore.storage import connect_per_process
+from wordleCore.telemetry import Progress, log
+
+SOLVER_VERSION = 1  # bump when the search changes so stale transposition tables are ignored
+TRANSPOSITION_SCHEMA = ("CREATE TABLE IF NOT EXISTS nodes (state BLOB NOT NULL, depth INTEGER NOT NULL, "
+                        "lower INTEGER NOT NULL, exact INTEGER NOT NULL, guess INTEGER NOT NULL, "
+                        "PRIMARY KEY (state, depth));")
+GUESS_CAP = 50  # guesses expanded per node, best bounds first; None expands every useful guess
+MAX_GUESSES = 6  # worst-case guesses allowed; None minimizes the expected count with no limit
+CHECKPOINT_SECONDS = 30.0  # transposition table entries are written to disk at least this often
+INFEASIBLE = 1 << 40  # cost of a state that cannot be solved in the guesses left
+SPLITS = NUM_PATTERNS - 1  # buckets other than all-green a guess can split a set into
+
+
+# Cheapest conceivable cost of a set of each size 0..n with `depth` guesses left (None: no limit)
+def size_bounds(n, depth):
+    bounds = np.full(n + 1, INFEASIBLE, dtype=np.int64)
+    for size in range(n + 1):
+        total, left, level, capacity = 0, size, 1, 1
+        while left and (depth is None or level <= depth):
+            take = min(left, capacity)
+            total += take * level
+            left -= take
+            capacity = SPLITS ** level
+            level += 1
+        if not left:
+            bounds[size] = total
+    return bounds
+
+
+def state_key(answer_idx):
+    return np.asarray(answer_idx, dtype=np.uint16).tobytes()
+
+
+class OptimalSolver:
+    def __init__(self, guesses=None, guess_cap=GUESS_CAP, max_guesses=MAX_GUESSES, name="optimal",
+                 on_disk=True, table=None):
+        self.table = table or get_pattern_table()
+        self.guesses = list(self.table.guesses if guesses is None else guesses)
+        self.guess_rows = np.array([self.table.guess_index[w] for w in self.guesses], dtype=np.intp)
+        # Answers are guessed once they are the last candidates, so they must be guessable
+        self.answer_rows = np.array([self.table.guess_index[w] for w in self.table.answers], dtype=np.intp)
+        self.guess_cap = guess_cap
+        self.max_guesses = max_guesses
+        self.name = name
+        self.nodes = {}  # (state key, guesses left) -> (lower bound, exact, best guess row or -1)
+        self.pending = {}
+        self.expanded = 0
+        self.hits = 0
+        self._bounds = {}
+        self.path = None
+        self.last_checkpoint = time.monotonic()
+        if on_disk:
+            fingerprint = words_fingerprint(self.guesses, self.table.answers)
+            config = f"cap{guess_cap or 'all'}_depth{max_guesses or 'any'}_v{SOLVER_VERSION}"
+            self.path = os.path.join(CACHE_DIR, f"transpositions_{name}_{fingerprint}_{config}.sqlite")
+            self._connection = connect_per_process(self.path, TRANSPOSITION_SCHEMA)
+            self.load()
+
+    # Size bounds for sets with `depth` guesses left, over every possible set size
+    def bounds(self, depth):
+        if depth not in self._bounds:
+            self._bounds[depth] = size_bounds(len(self.table.answers), depth)
+        return self._bounds[depth]
+
+    @property
+    def db(self):
+        return self._connection()
+
+    # Transposition table from the last checkpoint
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        for state, depth, lower, exact, guess in self.db.execute("SELECT * FROM nodes"):
+            self.nodes[(state, depth)] = (lower, bool(exact), guess)
+        log(f"Resuming from {len(self.nodes)} solved states in {self.path}")
+
+    # Write entries added since the last checkpoint in one transaction
+    def checkpoint(self):
+        self.last_checkpoint = time.monotonic()
+        if self.path is None or not self.pending:
+            return
+        rows = [(state, depth, lower, int(exact), guess) for (state, depth), (lower, exact, guess) in self.pending.items()]
+        self.db.execute("BEGIN IMMEDIATE")
+        self.db.executemany("INSERT OR REPLACE INTO nodes VALUES (?, ?, ?, ?, ?)", rows)
+        self.db.execute("COMMIT")
+        self.pending = {}
+
+    def _store(self, key, lower, exact, guess):
+        # Exact entries are final; a lower bound only replaces a weaker one
+        old = self.nodes.get(key)
+        if old is not None and (old[1] or (not exact and old[0] >= lower)):
+            return
+        self.nodes[key] = self.pending[key] = (lower, exact, guess)
+        if time.monotonic() - self.last_checkpoint >= CHECKPOINT_SECONDS:
+            self.checkpoint()
+
+    # Lower bound of every guess in the pool on the set; guesses that do not split it are INFEASIBLE
+    def guess_bounds(self, answer_idx, child_bounds):
+        n = len(answer_idx)
+        if n <= SORT_THRESHOLD:
+            ordered = np.sort(pattern_block(answer_idx, self.guess_rows, self.table), axis=1)
+            last = np.ones(ordered.shape, dtype=bool)
+            last[:, :-1] = ordered[:, 1:] != ordered[:, :-1]
+            # Bucket sizes sit at the last position of each run of equal codes
+            positions = np.arange(n)
+            run_start = np.zeros(ordered.shape, dtype=np.intp)
+            run_start[:, 1:] = np.where(last[:, :-1], positions[1:], 0)
+            np.maximum.accumulate(run_start, axis=1, out=run_start)
+            sizes = np.where(last, positions - run_start + 1, 0)
+            green = ordered[:, -1] == ALL_GREEN
+            splits = last.sum(axis=1) > 1
+        else:
+            sizes = pattern_histograms(answer_idx, self.guess_rows, self.table)
+            green = sizes[:, ALL_GREEN] > 0
+            splits = sizes.max(axis=1) < n
+        # The answer in the all-green bucket costs nothing past this guess
+        bounds = n + child_bounds[sizes].sum(axis=1) - np.where(green, child_bounds[1], 0)
+        bounds[~(splits | green)] = INFEASIBLE
+        return np.minimum(bounds, INFEASIBLE), green
+
+    # Cost of solving the set with `depth` guesses left if it is below beta, else a lower bound >= beta
+    def search(self, answer_idx, depth, beta=INFEASIBLE):
+        n = len(answer_idx)
+        if depth is not None and depth < (1 if n == 1 else 2):
+            return INFEASIBLE
+        if n <= 2:
+            return 2 * n - 1
+        key = (state_key(answer_idx), depth or 0)
+        entry = self.nodes.get(key)
+        if entry is not None:
+            self.hits += 1
+            if entry[1] or entry[0] >= beta:
+                return entry[0]
+        self.expanded += 1
+        child_depth = None if depth is None else depth - 1
+        child_bounds = self.bounds(child_depth)
+        bounds, green = self.guess_bounds(answer_idx, child_bounds)
+        order = np.lexsort((~green, bounds))
+        order = order[bounds[order] < INFEASIBLE][:self.guess_cap]
+        best, best_guess, floor = beta, -1, INFEASIBLE
+        for i in order:
+            if bounds[i] >= best:
+                floor = min(floor, int(bounds[i]))
+                break
+            value = self.expand(answer_idx, self.guess_rows[i], depth, best)
+            if value < best:
+                best, best_guess = value, int(self.guess_rows[i])
+            else:
+                floor = min(floor, value)
+        if best_guess >= 0:
+            self._store(key, best, True, best_guess)
+            return best
+        self._store(key, floor, False, -1)
+        return floor
+
+    # Cost of playing the guess row on the set, exact if below beta, else a lower bound >= beta
+    def expand(self, answer_idx, row, depth, beta=INFEASIBLE, progress=None):
+        child_depth = None if depth is None else depth - 1
+        child_bounds = self.bounds(child_depth)
+        codes = self.table.matrix[row, answer_idx]
+        order = np.argsort(codes, kind="stable")
+        ordered = codes[order]
+        edges = np.flatnonzero(ordered[1:] != ordered[:-1]) + 1
+        buckets = [answer_idx[part] for part, code in zip(np.split(order, edges), ordered[np.r_[0, edges]])
+                   if code != ALL_GREEN]
+        buckets.sort(key=len, reverse=True)  # the largest buckets are most likely to exceed beta
+        total = len(answer_idx) + sum(int(child_bounds[len(b)]) for b in buckets)
+        for bucket in buckets:
+            if total >= beta:
+                return total
+            bound = int(child_bounds[len(bucket)])
+            total += self.search(bucket, child_depth, beta - (total - bound)) - bound
+            if progress is not None:
+                progress.update()
+        return total
+
+    # Optimal cost over every answer, optionally with the first guess fixed
+    def solve(self, first_guess=None):
+        answer_idx = np.arange(len(self.table.answers))
+        try:
+            if first_guess is None:
+                return self.search(answer_idx, self.max_guesses)
+            row = self.table.guess_index[first_guess]
+            progress = Progress(f"buckets below {first_guess}", len(np.unique(self.table.matrix[row])))
+            cost = self.expand(answer_idx, row, self.max_guesses, progress=progress)
+            progress.finish()
+            return cost
+        finally:
+            self.checkpoint()
+
+    # Guess row for the set from the solved table (solving it first if needed)
+    def best_guess_row(self, answer_idx, depth):
+        if len(answer_idx) <= 2:
+            return int(self.answer_rows[answer_idx[0]])
+        entry = self.nodes.get((state_key(answer_idx), depth or 0))
+        if entry is None or not entry[1]:
+            self.search(answer_idx, depth)
+            entry = self.nodes[(state_key(answer_idx), depth or 0)]
+        return entry[2]
+
+    # Solver-style next guess, for compile_decision_tree
+    def next_guess(self, candidates, history, first_guess=None):
+        if not history and first_guess is not None:
+            return first_guess
+        depth = None if self.max_guesses is None else self.max_guesses - len(history)
+        answer_idx = candidates.indices if isinstance(candidates, CandidateSet) else \
+            np.sort([self.table.answer_index[w] for w in candidates])
+        return self.table.guesses[self.best_guess_row(answer_idx, depth)]
+
+
+if __name__ == "__main__":
+    first_guess = sys.argv[1] if len(sys.argv) > 1 and sys.argv[1] != "-" else None
+    cap = GUESS_CAP
+    if len(sys.argv) > 2:
+        cap = None if sys.argv[2] == "none" else int(sys.argv[2])
+    pool = sys.argv[3] if len(sys.argv) > 3 else "answers"
+    table = get_pattern_table()
+    solver = OptimalSolver(table.answers if pool == "answers" else table.guesses, cap, name=f"optimal-{pool}")
+    start = time.perf_counter()
+    try:
+        cost = solver.solve(first_guess)
+    except KeyboardInterrupt:
+        print(f"\nInterrupted, {len(solver.nodes)} solved states saved to {solver.path}; run again to resume")
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+    print(f"Optimal cost {cost} ({cost / len(table.answers):.4f} guesses per answer) in {elapsed:.1f}s: "
+          f"{solver.expanded} states expanded, {solver.hits} table hits, {len(solver.nodes)} states stored")
+    name = solver.name if first_guess is None else f"{solver.name}-{first_guess}"
+    tree = compile_decision_tree(lambda c, h: solver.next_guess(c, h, first_guess), name, table,
+                                 MAX_GUESSES if solver.max_guesses is None else solver.max_guesses)
+    solver.checkpoint()
+    path = tree_path(name, solver.guesses, table, code_fingerprint([sys.modules[__name__]]))
+    save_decision_tree(tree, path)
+    print(f"Compiled {len(tree)} nodes to {path}")
+    print_distribution(tree.distribution())
@@ -0,0 +1,96 @@
+# Per-answer outcome cache
+# A deterministic solver always plays the same game for a given answer, so each answer's outcome
+# (guess count and guess path) only needs computing once. Outcomes are saved as JSON under
+# wordleCore/cache/, keyed by the word lists, the source of the code that plays the game and any
+# settings that change its choices, so editing any of them rebuilds the cache. "N random games"
+# then becomes sampling answers and reading their outcomes.
+
+import hashlib
+import inspect
+import json
+import os
+
+import numpy as np
+
+from wordleCore.pattern_matrix import CACHE_DIR, words_fingerprint
+from wordleCore.sim_engine import empty_tally
+from wordleCore.storage import atomic_write
+
+OUTCOME_VERSION = 1  # bump when the cache format changes
+
+
+# Short hash of the source of the given modules/functions plus any extra settings
+def code_fingerprint(sources, settings=None):
+    digest = hashlib.sha1()
+    for obj in sources:
+        digest.update(inspect.getsource(obj).encode())
+    digest.update(json.dumps(settings or {}, sort_keys=True).encode())
+    return digest.hexdigest()[:12]
+
+
+class OutcomeCache:
+    def __init__(self, name, answers, outcomes):
+        self.name = name
+        self.answers = answers
+        self.outcomes = outcomes  # answer -> (guesses or None, [guess, ...])
+
+    def guesses(self, answer):
+        return self.outcomes[answer][0]
+
+    def path(self, answer):
+        return self.outcomes[answer][1]
+
+    # Times each answer is drawn in n random games, weighted by weights (uniform by default).
+    # Only the per-answer draw counts are sampled, so the cost does not grow with n.
+    def sample_counts(self, n, weights=None, rng=None):
+        rng = rng or np.random.default_rng()
+        p = np.full(len(self.answers), 1 / len(self.answers)) if weights is None \
+            else np.asarray(weights, dtype=np.float64) / np.sum(weights)
+        return rng.multinomial(n, p)
+
+    # Tally of n random games (see sample_counts)
+    def sample(self, n, weights=None, rng=None):
+        return self.tally(self.sample_counts(n, weights, rng))
+
+    # Tally with each answer played counts[i] times (every answer once by default)
+    def tally(self, counts=None):
+        tally = empty_tally()
+        failed_words = set()
+        if counts is None:
+            counts = np.ones(len(self.answers), dtype=np.int64)
+        for answer, count in zip(self.answers, counts):
+            if not count:
+                continue
+            guesses = self.guesses(answer)
+            if guesses is None:
+                tally["failed"] += int(count)
+                failed_words.add(answer)
+            else:
+                tally[str(guesses)] += int(count)
+        return tally, failed_words
+
+
+def outcome_path(name, answers, code_key):
+    return os.path.join(CACHE_DIR, f"outcomes_{name}_{words_fingerprint(answers, answers)}_{code_key}.json")
+
+
+def save_outcome_cache(cache, path):
+    with atomic_write(path, "w") as f:
+        json.dump({"version": OUTCOME_VERSION, "name": cache.name, "outcomes": cache.outcomes}, f)
+
+
+# Load the solver's outcomes, playing every answer with play_fn(answer) -> (guesses or None, path)
+# when the cache is missing or was built from different words or code
+def load_outcome_cache(name, play_fn, answers, code_key):
+    path = outcome_path(name, answers, code_key)
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+        if data["version"] == OUTCOME_VERSION and set(data["outcomes"]) == set(answers):
+            return OutcomeCache(name, answers, {answer: tuple(data["outcomes"][answer]) for answer in answers})
+    except (FileNotFoundError, ValueError, KeyError):
+        pass
+    print(f"Building {name} outcome cache ({len(answers)} answers), this only happens once per code change...")
+    cache = OutcomeCache(name, answers, {answer: play_fn(answer) for answer in answers})
+    save_outcome_cache(cache, path)
+    return cache
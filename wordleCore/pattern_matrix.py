@@ -0,0 +1,112 @@
+# Precomputed Wordle feedback pattern matrix
+# Encodes the feedback of every wordle_bank.txt guess against every wordle_targets.txt answer
+# as a base-3 integer (0-242) in a uint8 matrix. The matrix is built once, saved to disk and
+# memory-mapped on load so feedback becomes an O(1) lookup shared between processes.
+
+import hashlib
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wordleCore.feedback_kernel import feedback_matrix
+from wordleCore.storage import atomic_write
+from wordleCore.vocabulary import CACHE_DIR, get_answers, get_guesses
+
+# Digit of each feedback mark, position i is weighted by 3**i
+MARK_DIGITS = {'.': 0, 'y': 1, 'g': 2}
+DIGIT_MARKS = '.yg'
+ALL_GREEN = 242  # pattern_to_code("ggggg")
+
+_TABLE = None
+
+
+# Convert a g/y/. feedback string into its pattern code
+def pattern_to_code(feedback):
+    code = 0
+    for i, mark in enumerate(feedback):
+        code += MARK_DIGITS[mark] * 3 ** i
+    return code
+
+
+# Convert a pattern code back into a g/y/. feedback string
+def code_to_pattern(code):
+    marks = []
+    for _ in range(5):
+        marks.append(DIGIT_MARKS[code % 3])
+        code //= 3
+    return ''.join(marks)
+
+
+# Short hash of both word lists, used to tell stale matrices apart
+def words_fingerprint(guesses, answers):
+    digest = hashlib.sha1()
+    digest.update("\n".join(guesses).encode())
+    digest.update(b"|")
+    digest.update("\n".join(answers).encode())
+    return digest.hexdigest()[:12]
+
+
+def matrix_path(guesses, answers):
+    return os.path.join(CACHE_DIR, f"pattern_matrix_{words_fingerprint(guesses, answers)}.npy")
+
+
+# Compute the full guesses x answers matrix of pattern codes with the batched kernel,
+# spot-checked against the reference feedback_code
+def build_pattern_matrix(guesses, answers):
+    return feedback_matrix(guesses, answers, check=True)
+
+
+# Write the matrix atomically so concurrent readers never map a partial file
+def save_pattern_matrix(matrix, path):
+    with atomic_write(path) as f:
+        np.save(f, matrix)
+
+
+# Memory-map the matrix for these word lists, building and saving it first if missing
+def load_pattern_matrix(guesses, answers, build=True):
+    path = matrix_path(guesses, answers)
+    if not os.path.exists(path):
+        if not build:
+            raise FileNotFoundError(f"No pattern matrix at {path}, run pattern_matrix.py to build it")
+        print(f"Building pattern matrix ({len(guesses)} x {len(answers)}), this only happens once...")
+        save_pattern_matrix(build_pattern_matrix(guesses, answers), path)
+    return np.load(path, mmap_mode='r')
+
+
+# Pattern matrix plus the word -> row/column lookups
+class PatternTable:
+    def __init__(self, guesses, answers, matrix):
+        self.guesses = guesses
+        self.answers = answers
+        self.matrix = matrix
+        self.guess_index = {w: i for i, w in enumerate(guesses)}
+        self.answer_index = {w: i for i, w in enumerate(answers)}
+
+    # Row of pattern codes for a guess against every answer
+    def row(self, guess):
+        return self.matrix[self.guess_index[guess]]
+
+    def code(self, guess, answer):
+        return int(self.matrix[self.guess_index[guess], self.answer_index[answer]])
+
+    # Pattern codes for a guess against a list of answer words
+    def codes(self, guess, answers):
+        return self.row(guess)[[self.answer_index[a] for a in answers]]
+
+
+# Process-wide table over wordle_bank.txt x wordle_targets.txt, loaded on first use
+def get_pattern_table():
+    global _TABLE
+    if _TABLE is None:
+        guesses = get_guesses()
+        answers = get_answers()
+        _TABLE = PatternTable(guesses, answers, load_pattern_matrix(guesses, answers))
+    return _TABLE
+
+
+if __name__ == "__main__":
+    table = get_pattern_table()
+    print(f"Pattern matrix ready: {table.matrix.shape[0]} guesses x {table.matrix.shape[1]} answers "
+          f"({table.matrix.nbytes / 1e6:.1f} MB) at {matrix_path(table.guesses, table.answers)}")
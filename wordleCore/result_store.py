@@ -0,0 +1,171 @@
+# Per-game result store
+# Append-only SQLite table with one row per recorded game (answer, guess count, guess path,
+# solver, solver version, run and timing). It replaces rewriting wordle_stats.txt as the record
+# of what has been played: the stats files and README tables are regenerated from it.
+#
+# Every process opens its own connection in WAL mode, so parallel workers can write at the same
+# time. Rows are buffered and committed in batches (and at the end of every simulation chunk),
+# so an interrupted sweep keeps everything up to its last checkpoint.
+#
+# Usage: python wordleCore/result_store.py [solver]   (prints tallies and README tables)
+
+import json
+import os
+import sqlite3
+import sys
+import time
+import weakref
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from wordleCore.storage import connect_per_process
+from wordleCore.vocabulary import ROOT_DIR
+
+RESULTS_FILE = os.path.join(ROOT_DIR, "results", "games.sqlite")
+FLUSH_ROWS = 500  # buffered rows that trigger a commit
+LEGACY_RUN = "legacy"  # run id of tallies imported from a wordle_stats.txt
+
+_open_stores = weakref.WeakSet()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    solver TEXT NOT NULL,
+    version TEXT,
+    answer TEXT,            -- NULL for imported legacy tallies
+    guesses INTEGER,        -- NULL when the game failed
+    path TEXT,              -- guesses separated by spaces
+    seconds REAL,
+    games INTEGER NOT NULL DEFAULT 1,  -- identical games this row stands for (sampled runs)
+    recorded REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_by_solver ON games (solver, run_id, guesses);
+"""
+
+
+def new_run_id():
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+
+
+class ResultStore:
+    def __init__(self, solver, version=None, run_id=None, path=None):
+        self.solver = solver
+        self.version = version
+        self.run_id = run_id or new_run_id()
+        self.path = path or RESULTS_FILE
+        self.pending = []
+        self._pending_pid = os.getpid()
+        self._connection = connect_per_process(self.path, SCHEMA, timeout=60)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        _open_stores.add(self)
+
+    # SQLite connection for this process and thread
+    @property
+    def db(self):
+        return self._connection()
+
+    # Buffer one game (or `games` identical ones); commits every FLUSH_ROWS rows
+    def add(self, answer, guesses, path=None, seconds=None, games=1):
+        if self._pending_pid != os.getpid():  # rows buffered before a fork belong to the parent
+            self.pending = []
+            self._pending_pid = os.getpid()
+        self.pending.append((self.run_id, self.solver, self.version, answer, guesses,
+                             " ".join(path) if path else None, seconds, games, time.time()))
+        if len(self.pending) >= FLUSH_ROWS:
+            self.flush()
+
+    # Commit buffered rows in one transaction
+    def flush(self):
+        if not self.pending or self._pending_pid != os.getpid():
+            return
+        db = self.db
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            db.executemany("INSERT INTO games (run_id, solver, version, answer, guesses, path, seconds, games, "
+                           "recorded) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", self.pending)
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        self.pending = []
+
+    # Import a wordle_stats.txt tally once, so games played before the store existed still count
+    def import_legacy_tally(self, tally):
+        row = self.db.execute("SELECT 1 FROM games WHERE solver = ? AND run_id = ? LIMIT 1",
+                              (self.solver, LEGACY_RUN)).fetchone()
+        if row is not None or not any(tally.values()):
+            return
+        rows = [(LEGACY_RUN, self.solver, None, None, None if key == "failed" else int(key), None, None, count,
+                 time.time()) for key, count in tally.items() if count]
+        self.db.execute("BEGIN IMMEDIATE")
+        self.db.executemany("INSERT INTO games (run_id, solver, version, answer, guesses, path, seconds, games, "
+                            "recorded) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        self.db.execute("COMMIT")
+
+    def _where(self, run_id):
+        if run_id is None:
+            return "solver = ?", (self.solver,)
+        return "solver = ? AND run_id = ?", (self.solver, run_id)
+
+    # Tally in the wordle_stats.txt format, over every run or just one
+    def tally(self, run_id=None):
+        where, args = self._where(run_id)
+        tally = {str(i): 0 for i in range(1, 7)}
+        tally["failed"] = 0
+        for guesses, count in self.db.execute(
+                f"SELECT guesses, SUM(games) FROM games WHERE {where} GROUP BY guesses", args):
+            key = "failed" if guesses is None or guesses > 6 else str(guesses)
+            tally[key] += count
+        return tally
+
+    def failed_words(self, run_id=None):
+        where, args = self._where(run_id)
+        return {answer for (answer,) in self.db.execute(
+            f"SELECT DISTINCT answer FROM games WHERE {where} AND guesses IS NULL AND answer IS NOT NULL", args)}
+
+    # Per-version summary: (version, games, mean guesses when solved, mean seconds per game)
+    def versions(self):
+        return self.db.execute(
+            "SELECT version, SUM(games), SUM(guesses * games) * 1.0 / SUM(CASE WHEN guesses IS NULL THEN 0 "
+            "ELSE games END), AVG(seconds) FROM games WHERE solver = ? AND run_id != ? GROUP BY version "
+            "ORDER BY MIN(recorded)", (self.solver, LEGACY_RUN)).fetchall()
+
+
+# Commit every store this process has open (called before forking and after each sim chunk)
+def flush_stores():
+    for store in list(_open_stores):
+        store.flush()
+
+
+# Every solver with recorded games
+def recorded_solvers(path=None):
+    with sqlite3.connect(path or RESULTS_FILE) as db:
+        return [solver for (solver,) in db.execute("SELECT DISTINCT solver FROM games ORDER BY solver")]
+
+
+# A tally as the Markdown table used in the README
+def markdown_table(tally):
+    total = sum(tally.values())
+    lines = ["| Attempt | Count | Percentage |", "| ------- | ----- | ---------- |"]
+    for key in [str(i) for i in range(1, 7)] + ["failed"]:
+        percentage = f"{tally[key] / total * 100:.2f}%" if total else "0.00%"
+        lines.append(f"| {key:<7} | {tally[key]:<5} | {percentage:<10} |")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    if not os.path.exists(RESULTS_FILE):
+        print(f"No results recorded yet ({RESULTS_FILE})")
+        sys.exit(0)
+    solvers = sys.argv[1:] or recorded_solvers()
+    for solver in solvers:
+        store = ResultStore(solver)
+        tally = store.tally()
+        print(f"\n### {solver}: {sum(tally.values())} games")
+        print(markdown_table(tally))
+        for version, games, mean, seconds in store.versions():
+            timing = f", {seconds * 1000:.2f} ms/game" if seconds is not None else ""
+            print(f"- version {version}: {games} games, {mean or 0:.3f} mean guesses when solved{timing}")
+        failed = store.failed_words()
+        if failed:
+            print(f"- failed words: {json.dumps(sorted(failed))}")
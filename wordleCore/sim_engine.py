@@ -0,0 +1,87 @@
+# Parallel simulation engine
+# Plays a list of answers across a process pool and merges each worker's tally into the
+# wordle_stats.txt format. Workers are forked where possible so they share the already loaded
+# word lists, and every worker maps the same pattern matrix file pages instead of a copy.
+
+import multiprocessing
+import os
+
+from wordleCore.guess_cache import flush_caches
+from wordleCore.result_store import flush_stores
+from wordleCore.telemetry import (QUIET, SILENT, Progress, get_verbosity, merge_phases, phase_totals,
+                                  reset_phases, set_verbosity)
+
+MAX_CHUNK_SIZE = 64
+
+
+def empty_tally():
+    tally = {str(i): 0 for i in range(1, 7)}
+    tally["failed"] = 0
+    return tally
+
+
+def merge_tally(tally, other):
+    for key, count in other.items():
+        tally[key] = tally.get(key, 0) + count
+    return tally
+
+
+# Count one game's result (guess count, or None for a failure) into the tally
+def record_result(tally, failed_words, answer, guesses):
+    if guesses is not None and 1 <= guesses <= 6:
+        tally[str(guesses)] += 1
+    elif guesses is None:
+        tally["failed"] += 1
+        failed_words.add(answer)
+
+
+def _play_chunk(args):
+    play_fn, answers, verbosity = args
+    set_verbosity(verbosity)
+    reset_phases()
+    tally = empty_tally()
+    failed_words = set()
+    for answer in answers:
+        record_result(tally, failed_words, answer, play_fn(answer))
+    flush_stores()  # checkpoint: this chunk's recorded games are committed before it reports back
+    flush_caches()
+    return tally, failed_words, phase_totals()
+
+
+def _pool_context():
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+# Play every answer with play_fn (a module-level function answer -> guesses or None).
+# Returns (tally, failed_words) for this run only; workers=1 plays in this process. Worker
+# phase timings are merged into this process's telemetry.
+def run_games(play_fn, answers, workers=None, chunk_size=None):
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(answers) <= 1:
+        tally = empty_tally()
+        failed_words = set()
+        progress = Progress("games", len(answers))
+        for answer in answers:
+            record_result(tally, failed_words, answer, play_fn(answer))
+            progress.update()
+        flush_stores()
+        flush_caches()
+        return tally, failed_words
+    chunk_size = chunk_size or max(1, min(MAX_CHUNK_SIZE, len(answers) // (workers * 4)))
+    # Per-turn lines from many workers would interleave, so workers only keep QUIET summaries
+    worker_verbosity = QUIET if get_verbosity() == QUIET else SILENT
+    chunks = [(play_fn, answers[i:i + chunk_size], worker_verbosity) for i in range(0, len(answers), chunk_size)]
+    tally = empty_tally()
+    failed_words = set()
+    progress = Progress("games", len(answers))
+    flush_stores()  # nothing buffered may be copied into the forked workers
+    flush_caches()
+    with _pool_context().Pool(workers) as pool:
+        for part_tally, part_failed, part_phases in pool.imap_unordered(_play_chunk, chunks):
+            merge_tally(tally, part_tally)
+            failed_words |= part_failed
+            merge_phases(part_phases)
+            progress.update(sum(part_tally.values()))
+    return tally, failed_words
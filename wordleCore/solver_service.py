@@ -0,0 +1,450 @@
+# Local solver service
+# A long-running asyncio HTTP server exposing the entropy solver over JSON, so tools share one
+# process (word lists, pattern table, opening book, decision tree and guess cache are loaded once)
+# instead of each running an interactive main() loop.
+#
+#   POST   /sessions                       {"hard_mode": false} -> {"session": id, "candidates": n}
+#   GET    /sessions/<id>                  candidates left and the guess history
+#   POST   /sessions/<id>/guesses          {"guess": "raise", "feedback": "g..y."}
+#   GET    /sessions/<id>/recommendations  ?k=5 -> {"best": guess, "top": [[guess, score], ...]}
+#   DELETE /sessions/<id>
+#   GET    /stats
+#
+# A session only holds its candidate indices (uint16, shared until the first guess narrows them),
+# its history and, in hard mode, its guess pool. Guesses submitted to one session are applied one
+# at a time. Scoring runs on a thread pool so the event loop keeps serving other sessions;
+# identical requests in flight at the same time share one computation, and top-k rankings are
+# memoized per candidate set.
+#
+# Usage:
+#   python wordleCore/solver_service.py serve [port]
+#   python wordleCore/solver_service.py load [sessions] [url]   (starts a server itself without a url)
+
+import asyncio
+import hashlib
+import json
+import os
+import random
+import secrets
+import socket
+import subprocess
+import sys
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+from wordleCore.candidate_set import CandidateSet
+from wordleCore.entropy_engine import rank_guesses
+from wordleCore.feedback_kernel import feedback_code
+from wordleCore.guess_cache import candidates_key
+from wordleCore.hard_mode import GuessPool
+from wordleCore.pattern_matrix import code_to_pattern, get_pattern_table
+from wordleCore.vocabulary import get_answers
+
+SOLVER_DIR = os.path.join(ROOT_DIR, "entropyAlgo")  # solver served (entropyAlgoV2 also works)
+HOST = "127.0.0.1"
+PORT = 8315
+SCORING_WORKERS = os.cpu_count()  # threads running guess selection and rankings
+SESSION_TTL = 3600  # seconds an idle session is kept
+TOP_K_MAX = 50
+RANKING_CACHE_ENTRIES = 10000
+MAX_BODY_BYTES = 1 << 16
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 409: "Conflict",
+               413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# Fingerprint of a hard-mode guess pool ("" when every guess is allowed)
+def pool_key(pool):
+    if pool is None:
+        return ""
+    return hashlib.blake2b(np.asarray(pool.indices, dtype=np.int32).tobytes(), digest_size=16).hexdigest()
+
+
+class Session:
+    __slots__ = ("indices", "history", "pool", "last_used", "lock")
+
+    def __init__(self, indices, pool):
+        self.indices = indices  # sorted uint16 answer indices
+        self.history = []  # (guess, feedback) pairs
+        self.pool = pool  # GuessPool in hard mode, else None
+        self.last_used = time.monotonic()
+        self.lock = asyncio.Lock()  # held while a guess is applied
+
+
+class SolverService:
+    def __init__(self, solver, workers=SCORING_WORKERS):
+        self.solver = solver
+        self.table = get_pattern_table()
+        self.all_indices = np.arange(len(self.table.answers), dtype=np.uint16)
+        self.initial_pool = None  # hard-mode pool shared by new sessions until their first guess
+        self.sessions = {}
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scoring")
+        self.in_flight = {}
+        self.rankings = OrderedDict()
+        self.requests = defaultdict(int)
+        self.started = time.time()
+        self.last_sweep = time.monotonic()
+        solver.get_guess_cache()
+        solver.get_opening_book()
+        if solver.USE_DECISION_TREE:
+            solver.get_decision_tree()
+
+    # Run fn(*args) on the scoring threads, sharing the result with identical requests in flight
+    async def _shared(self, key, fn, *args):
+        future = self.in_flight.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+            self.in_flight[key] = future
+            future.add_done_callback(lambda _: self.in_flight.pop(key, None))
+        return await asyncio.shield(future)  # a disconnecting client must not cancel the others
+
+    def _session(self, session_id):
+        session = self.sessions.get(session_id)
+        if session is None:
+            raise HTTPError(404, f"unknown session {session_id}")
+        session.last_used = time.monotonic()
+        return session
+
+    def _sweep(self):
+        now = time.monotonic()
+        if now - self.last_sweep < 60:
+            return
+        self.last_sweep = now
+        for session_id in [s for s, session in self.sessions.items() if now - session.last_used > SESSION_TTL]:
+            del self.sessions[session_id]
+
+    def _state(self, session_id, session):
+        state = {"session": session_id, "candidates": len(session.indices),
+                 "history": [list(turn) for turn in session.history]}
+        if len(session.indices) <= 20:
+            state["remaining"] = [self.table.answers[i] for i in session.indices]
+        return state
+
+    def create_session(self, body):
+        self._sweep()
+        pool = None
+        if body.get("hard_mode"):
+            if self.initial_pool is None:
+                self.initial_pool = GuessPool(self.solver.GUESS_POOL)
+            pool = self.initial_pool
+        session_id = secrets.token_hex(8)
+        self.sessions[session_id] = Session(self.all_indices, pool)
+        return {"session": session_id, "candidates": len(self.all_indices)}
+
+    async def submit_guess(self, session_id, body):
+        session = self._session(session_id)
+        guess = str(body.get("guess", "")).lower()
+        feedback = str(body.get("feedback", "")).lower()
+        if guess not in self.table.guess_index:
+            raise HTTPError(400, f"{guess!r} is not a valid guess")
+        if len(feedback) != 5 or not all(c in "gy." for c in feedback):
+            raise HTTPError(400, "feedback must be 5 characters of g, y and .")
+        # The pool is restricted off the event loop; without the lock, two guesses to one session
+        # could both read the old state and the last to finish would drop the other's turn
+        async with session.lock:
+            if session.pool is not None and guess not in session.pool:
+                raise HTTPError(409, f"hard mode: {guess!r} does not use every revealed hint")
+            pool = session.pool
+            if pool is not None:  # a feedback pass over the whole pool, so off the event loop
+                pool = await asyncio.get_running_loop().run_in_executor(self.executor, pool.restrict, guess, feedback)
+            candidates = CandidateSet(session.indices, self.table).filter(guess, feedback)
+            session.indices = candidates.indices.astype(np.uint16)
+            session.history.append((guess, feedback))
+            session.pool = pool
+            state = self._state(session_id, session)
+        state["solved"] = feedback == "ggggg"
+        return state
+
+    def _rank(self, candidates, pool, k):
+        guesses = self.solver.GUESS_POOL if pool is None else pool
+        return [[w, round(score, 6)] for w, score in
+                rank_guesses(candidates, guesses, k, policy=self.solver.SCORING_POLICY)]
+
+    async def recommend(self, session_id, k):
+        session = self._session(session_id)
+        if not len(session.indices):
+            raise HTTPError(409, "no candidates left, check the feedback")
+        candidates = CandidateSet(session.indices, self.table)
+        history = list(session.history)
+        pool_hash = pool_key(session.pool)
+        if len(candidates) == 1:
+            best = candidates[0]
+        else:
+            key = ("best", tuple(history), pool_hash)
+            best = await self._shared(key, self.solver.next_guess, candidates, history, session.pool)
+        ranking_key = (candidates_key(candidates), pool_hash, k)
+        top = self.rankings.get(ranking_key)
+        if top is None:
+            top = await self._shared(("top",) + ranking_key, self._rank, candidates, session.pool, k)
+            self.rankings[ranking_key] = top
+            if len(self.rankings) > RANKING_CACHE_ENTRIES:
+                self.rankings.popitem(last=False)
+        else:
+            self.rankings.move_to_end(ranking_key)
+        return {"best": best, "top": top, "candidates": len(candidates)}
+
+    def stats(self):
+        cache = self.solver.get_guess_cache()
+        return {"sessions": len(self.sessions), "requests": dict(self.requests),
+                "uptime_seconds": round(time.time() - self.started, 1), "guess_cache": cache.stats(),
+                "rankings_cached": len(self.rankings)}
+
+    async def dispatch(self, method, target, body):
+        url = urlsplit(target)
+        parts = [p for p in url.path.split("/") if p]
+        query = parse_qs(url.query)
+        if parts == ["stats"] and method == "GET":
+            self.requests["stats"] += 1
+            return self.stats()
+        if not parts or parts[0] != "sessions" or len(parts) > 3:
+            raise HTTPError(404, f"no route for {url.path}")
+        if len(parts) == 1:
+            if method != "POST":
+                raise HTTPError(405, "use POST to create a session")
+            self.requests["create"] += 1
+            return self.create_session(body)
+        session_id = parts[1]
+        if len(parts) == 2:
+            if method == "GET":
+                self.requests["state"] += 1
+                return self._state(session_id, self._session(session_id))
+            if method == "DELETE":
+                self.requests["delete"] += 1
+                self._session(session_id)
+                del self.sessions[session_id]
+                return {"deleted": session_id}
+            raise HTTPError(405, "use GET or DELETE on a session")
+        if parts[2] == "guesses" and method == "POST":
+            self.requests["guess"] += 1
+            return await self.submit_guess(session_id, body)
+        if parts[2] == "recommendations" and method == "GET":
+            self.requests["recommend"] += 1
+            try:
+                k = min(max(int(query.get("k", ["5"])[0]), 1), TOP_K_MAX)
+            except ValueError:
+                raise HTTPError(400, "k must be an integer")
+            return await self.recommend(session_id, k)
+        raise HTTPError(404 if parts[2] not in ("guesses", "recommendations") else 405, f"no route for {method} {url.path}")
+
+
+# (method, target, headers, body) of the next request on the connection, or None once it closes
+async def read_request(reader):
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, target, _ = line.decode("latin-1").split(" ", 2)
+    except ValueError:
+        raise HTTPError(400, "malformed request line")
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length", 0) or 0)
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(413, "request body too large")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), target, headers, body
+
+
+def encode_response(status, payload, keep_alive=True):
+    body = json.dumps(payload).encode()
+    head = (f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    return head.encode() + body
+
+
+async def handle_connection(service, reader, writer):
+    try:
+        while True:
+            try:
+                request = await read_request(reader)
+                if request is None:
+                    break
+                method, target, headers, raw = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+                try:
+                    body = json.loads(raw) if raw else {}
+                except ValueError:
+                    raise HTTPError(400, "body must be JSON")
+                if not isinstance(body, dict):
+                    raise HTTPError(400, "body must be a JSON object")
+                status, payload = 200, await service.dispatch(method, target, body)
+            except HTTPError as e:
+                status, payload, keep_alive = e.status, {"error": str(e)}, e.status < 500 and e.status != 413
+            except (ConnectionError, asyncio.IncompleteReadError):
+                break
+            except Exception as e:
+                status, payload, keep_alive = 500, {"error": f"{type(e).__name__}: {e}"}, False
+            writer.write(encode_response(status, payload, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+def load_solver(solver_dir=SOLVER_DIR):
+    sys.path.insert(0, solver_dir)
+    import entropy_wordleai  # only importable once its directory is on the path
+    return entropy_wordleai
+
+
+async def serve(port=PORT, host=HOST):
+    service = SolverService(load_solver())
+    server = await asyncio.start_server(lambda r, w: handle_connection(service, r, w), host, port, backlog=1024)
+    print(f"Serving {service.solver.SOLVER_NAME} on http://{host}:{port}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+# Load generator: every session plays one random answer by asking the service for the best guess
+# and submitting the feedback, over its own keep-alive connection
+
+class Client:
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def request(self, method, path, payload=None):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.writer.write(f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\nContent-Length: {len(body)}\r\n\r\n"
+                          .encode() + body)
+        await self.writer.drain()
+        status_line = await self.reader.readline()
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        data = json.loads(await self.reader.readexactly(int(headers.get("content-length", 0))))
+        status = int(status_line.split()[1])
+        if status != 200:
+            raise RuntimeError(f"{method} {path} -> {status}: {data.get('error')}")
+        return data
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+async def play_session(client, answer, latencies):
+    async def timed(name, method, path, payload=None):
+        start = time.perf_counter()
+        data = await client.request(method, path, payload)
+        latencies[name].append(time.perf_counter() - start)
+        return data
+
+    session = (await timed("create", "POST", "/sessions", {}))["session"]
+    for turn in range(1, 7):
+        guess = (await timed("recommend", "GET", f"/sessions/{session}/recommendations?k=5"))["best"]
+        feedback = code_to_pattern(feedback_code(guess, answer))
+        await timed("guess", "POST", f"/sessions/{session}/guesses", {"guess": guess, "feedback": feedback})
+        if feedback == "ggggg":
+            break
+    else:
+        turn = None
+    await timed("delete", "DELETE", f"/sessions/{session}")
+    client.close()
+    return turn
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind((HOST, 0))
+        return s.getsockname()[1]
+
+
+# Start `serve` in a subprocess and wait until it accepts connections
+async def start_server_process(port, timeout=120):
+    process = subprocess.Popen([sys.executable, os.path.abspath(__file__), "serve", str(port)])
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            _, writer = await asyncio.open_connection(HOST, port)
+            writer.close()
+            return process
+        except OSError:
+            if process.poll() is not None:
+                raise RuntimeError("solver service exited during startup")
+            await asyncio.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f"solver service did not start within {timeout}s")
+
+
+def percentiles_line(name, samples):
+    ms = np.array(samples) * 1000
+    return (f"{name:<10} {len(ms):>7} requests  p50 {np.percentile(ms, 50):>8.2f} ms  p90 {np.percentile(ms, 90):>8.2f} ms  "
+            f"p99 {np.percentile(ms, 99):>8.2f} ms  max {ms.max():>8.2f} ms")
+
+
+async def run_load(sessions=300, url=None, seed=2315):
+    process = None
+    if url is None:
+        port = free_port()
+        process = await start_server_process(port)
+        host = HOST
+    else:
+        parsed = urlsplit(url)
+        host, port = parsed.hostname, parsed.port or 80
+    try:
+        rng = random.Random(seed)
+        answers = [rng.choice(get_answers()) for _ in range(sessions)]
+        latencies = defaultdict(list)
+        start = time.perf_counter()
+        results = await asyncio.gather(*(play_session(Client(host, port), a, latencies) for a in answers),
+                                       return_exceptions=True)
+        elapsed = time.perf_counter() - start
+        errors = [r for r in results if isinstance(r, Exception)]
+        solved = [r for r in results if isinstance(r, int)]
+        total = sum(len(v) for v in latencies.values())
+        print(f"\n{sessions} concurrent sessions: {len(solved)} solved, {sessions - len(solved) - len(errors)} failed, "
+              f"{len(errors)} errors in {elapsed:.2f}s ({total / elapsed:.0f} requests/s)")
+        if solved:
+            print(f"Mean guesses when solved: {sum(solved) / len(solved):.4f}")
+        for name in ("create", "recommend", "guess", "delete"):
+            if latencies[name]:
+                print(percentiles_line(name, latencies[name]))
+        for error in errors[:5]:
+            print(f"error: {error}")
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "serve"
+    try:
+        if command == "serve":
+            asyncio.run(serve(int(sys.argv[2]) if len(sys.argv) > 2 else PORT))
+        elif command == "load":
+            asyncio.run(run_load(int(sys.argv[2]) if len(sys.argv) > 2 else 300,
+                                 sys.argv[3] if len(sys.argv) > 3 else None))
+        else:
+            print("Usage: python wordleCore/solver_service.py serve [port] | load [sessions] [url]")
+            sys.exit(2)
+    except KeyboardInterrupt:
+        pass
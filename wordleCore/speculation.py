@@ -0,0 +1,78 @@
+# Speculative next guesses
+# While the page animates the tiles of a guess, a background worker computes the next guess for
+# the feedback patterns most likely to come back (the buckets holding the most candidates), so
+# the guess is usually ready by the time the real feedback is read. The worker only reads shared
+# state (pattern table, guess cache, opening book), and a speculated guess is only used for the
+# pattern it was computed for, so speculation never changes which guess is played.
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from wordleCore.entropy_engine import answer_indices
+from wordleCore.hard_mode import update_guess_pool
+from wordleCore.pattern_matrix import ALL_GREEN, code_to_pattern, get_pattern_table, pattern_to_code
+
+SPECULATE_PATTERNS = 8  # most likely feedback patterns precomputed per turn
+
+
+class Speculator:
+    # next_guess_fn(candidates, history, pool) and filter_fn(candidates, guess, feedback) are the
+    # solver's own, e.g. entropy_wordleai.next_guess and filter_words
+    def __init__(self, next_guess_fn, filter_fn, max_patterns=SPECULATE_PATTERNS):
+        self.next_guess_fn = next_guess_fn
+        self.filter_fn = filter_fn
+        self.max_patterns = max_patterns
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="speculate")
+        self.futures = {}
+        self._wanted = [None]  # shared with this turn's jobs: None runs every pattern, else only this code
+        self.hits = 0
+        self.misses = 0
+
+    # Start computing next guesses for the likeliest feedback to guess (call right after playing it)
+    def start(self, candidates, history, pool, guess):
+        self.cancel()
+        history = list(history)  # the caller appends this turn before the jobs run
+        table = get_pattern_table()
+        codes, counts = np.unique(table.row(guess)[answer_indices(candidates, table)], return_counts=True)
+        likely = [int(code) for code in codes[np.argsort(-counts, kind="stable")] if code != ALL_GREEN]
+        wanted = self._wanted
+        for code in likely[:self.max_patterns]:
+            self.futures[code] = self.executor.submit(self._next_guess, wanted, candidates, history, pool, guess, code)
+
+    def _next_guess(self, wanted, candidates, history, pool, guess, code):
+        if wanted[0] is not None and wanted[0] != code:
+            return None
+        feedback = code_to_pattern(code)
+        remaining = self.filter_fn(candidates, guess, feedback)
+        if len(remaining) <= 1:
+            return remaining[0] if remaining else None
+        return self.next_guess_fn(remaining, history + [(guess, feedback)], update_guess_pool(pool, guess, feedback))
+
+    # Speculated next guess for the feedback that came back, or None if it was not speculated.
+    # Waits for it if the worker is still on it; every other pending pattern is dropped.
+    def take(self, feedback):
+        code = pattern_to_code(feedback) if isinstance(feedback, str) else feedback
+        future = self.futures.pop(code, None)
+        self._wanted[0] = code
+        self.cancel()
+        guess = future.result() if future is not None else None
+        if guess is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return guess
+
+    # Drop pending speculation (a pattern already being computed still finishes in the background)
+    def cancel(self):
+        if self._wanted[0] is None:
+            self._wanted[0] = -1
+        self._wanted = [None]
+        self.futures = {}
+
+    def shutdown(self):
+        self.cancel()
+        self.executor.shutdown(wait=False)
+
+    def stats(self):
+        return f"{self.hits} speculated guesses used, {self.misses} computed after the feedback"
@@ -0,0 +1,44 @@
+# Cache file helpers
+# Every cache under wordleCore/cache/ (and the result store) is shared by forked simulation
+# workers, threads and later runs, so files are written atomically and SQLite connections are
+# opened per process and thread.
+
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+
+# Open a temporary file next to path and move it over path once the block finishes, so readers
+# (or memory maps in other processes) never see a partial file. Nothing is replaced on error.
+@contextmanager
+def atomic_write(path, mode="wb"):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, mode) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+# Function returning this process's and thread's connection to the SQLite file at path, opened on
+# first use in WAL mode (so parallel workers can write at once) with the schema applied. A
+# connection must not be used across a fork, and sqlite3 only lets its own thread use it.
+def connect_per_process(path, schema="", timeout=30):
+    local = threading.local()
+
+    def connection():
+        if getattr(local, "db", None) is None or local.pid != os.getpid():
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            db = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            if schema:
+                db.executescript(schema)
+            local.db, local.pid = db, os.getpid()
+        return local.db
+
+    return connection
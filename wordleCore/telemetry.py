@@ -0,0 +1,118 @@
+# Progress and timing telemetry
+# Verbosity-gated logging, a throttled progress reporter (rate and ETA) and per-phase timers,
+# so long runs report what they are doing without printing a line per guess.
+#
+# Verbosity levels:
+#   SILENT  - nothing
+#   QUIET   - one JSON summary line per game
+#   NORMAL  - a line per turn plus throttled progress
+#   VERBOSE - everything, including candidate lists
+
+import json
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+SILENT, QUIET, NORMAL, VERBOSE = 0, 1, 2, 3
+PROGRESS_INTERVAL = 1.0  # seconds between progress lines
+
+_verbosity = NORMAL
+_phase_seconds = defaultdict(float)
+_phase_calls = defaultdict(int)
+
+
+def set_verbosity(level):
+    global _verbosity
+    _verbosity = level
+
+
+def get_verbosity():
+    return _verbosity
+
+
+def log(message, level=NORMAL):
+    if _verbosity >= level:
+        print(message)
+
+
+# One JSON line describing a finished game, printed in QUIET mode only. Written in a single
+# call so lines from parallel workers sharing stdout do not interleave.
+def game_summary(**fields):
+    if _verbosity == QUIET:
+        sys.stdout.write(json.dumps(fields, separators=(",", ":")) + "\n")
+        sys.stdout.flush()
+
+
+def format_seconds(seconds):
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m{seconds:02d}s" if hours else f"{minutes}m{seconds:02d}s"
+
+
+# Progress over a known number of steps, printing at most once per interval
+class Progress:
+    def __init__(self, label, total, interval=PROGRESS_INTERVAL, level=NORMAL):
+        self.label = label
+        self.total = total
+        self.interval = interval
+        self.level = level
+        self.done = 0
+        self.start = time.perf_counter()
+        self.last_report = self.start
+
+    def update(self, steps=1):
+        self.done += steps
+        now = time.perf_counter()
+        if now - self.last_report >= self.interval:
+            self.last_report = now
+            self.report(now)
+
+    def report(self, now=None):
+        now = now or time.perf_counter()
+        elapsed = now - self.start
+        rate = self.done / elapsed if elapsed > 0 else 0.0
+        eta = (self.total - self.done) / rate if rate > 0 else 0.0
+        log(f"[Progress] {self.label}: {self.done}/{self.total} ({rate:.1f}/s, "
+            f"elapsed {format_seconds(elapsed)}, ETA {format_seconds(eta)})", self.level)
+
+    def finish(self):
+        self.report()
+
+
+# Time a block under a phase name (e.g. "feedback", "filtering", "scoring")
+@contextmanager
+def phase(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _phase_seconds[name] += time.perf_counter() - start
+        _phase_calls[name] += 1
+
+
+# {phase: (seconds, calls)} accumulated in this process
+def phase_totals():
+    return {name: (_phase_seconds[name], _phase_calls[name]) for name in _phase_seconds}
+
+
+def reset_phases():
+    _phase_seconds.clear()
+    _phase_calls.clear()
+
+
+# Fold another process's phase_totals() into this one
+def merge_phases(totals):
+    for name, (seconds, calls) in totals.items():
+        _phase_seconds[name] += seconds
+        _phase_calls[name] += calls
+
+
+def phase_report():
+    lines = ["--- Phase timings ---"]
+    for name, (seconds, calls) in sorted(phase_totals().items(), key=lambda item: -item[1][0]):
+        per_call = seconds / calls * 1e6 if calls else 0.0
+        lines.append(f"{name}: {seconds:.3f}s over {calls} calls ({per_call:.1f} us/call)")
+    return "\n".join(lines)
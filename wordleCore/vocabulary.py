@@ -0,0 +1,101 @@
+# Shared vocabulary
+# Single place the word lists are loaded from. Paths resolve relative to the repository rather
+# than the working directory, nothing is read until a list is first asked for, and each list is
+# loaded once per process and shared by every module as a read-only tuple.
+#
+# Each list is also cached as a packed binary file under wordleCore/cache/ (one uint32 per word,
+# 5 bits per letter), memory-mapped read-only on later runs so startup skips parsing the text.
+# The cache file is keyed by the text file's size and modification time, so editing a word list
+# is picked up automatically.
+
+import os
+
+import numpy as np
+
+from wordleCore.storage import atomic_write
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TARGETS_FILE = os.path.join(ROOT_DIR, "wordle_targets.txt")
+BANK_FILE = os.path.join(ROOT_DIR, "wordle_bank.txt")
+CACHE_DIR = os.path.join(ROOT_DIR, "wordleCore", "cache")
+
+LETTER_BITS = 5
+LETTER_SHIFTS = np.arange(5, dtype=np.uint32) * LETTER_BITS
+
+_words = {}  # path -> tuple of words
+_packed = {}  # path -> read-only uint32 array
+
+
+# Parse a word list (one 5-letter word per line)
+def read_word_file(path):
+    with open(path, "r") as f:
+        return [w.strip().lower() for w in f.readlines() if len(w.strip()) == 5]
+
+
+# One uint32 per word, letter i in bits 5i..5i+4 (a = 0)
+def pack_words(words):
+    letters = np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8).reshape(-1, 5)
+    return ((letters.astype(np.uint32) - ord('a')) << LETTER_SHIFTS).sum(axis=1, dtype=np.uint32)
+
+
+def unpack_words(packed):
+    letters = ((np.asarray(packed, dtype=np.uint32)[:, None] >> LETTER_SHIFTS) & 31).astype(np.uint8) + ord('a')
+    text = letters.tobytes().decode("ascii")
+    return tuple(text[i:i + 5] for i in range(0, len(text), 5))
+
+
+def packed_path(path):
+    stat = os.stat(path)
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(CACHE_DIR, f"vocab_{name}_{stat.st_size}_{stat.st_mtime_ns}.npy")
+
+
+def _save_packed(packed, path):
+    with atomic_write(path) as f:
+        np.save(f, packed)
+
+
+# Load a word list through the registry and its packed cache
+def load_vocabulary(path):
+    path = os.path.abspath(path)
+    if path in _words:
+        return _words[path]
+    cache_path = packed_path(path)
+    try:
+        packed = np.load(cache_path, mmap_mode='r')
+        words = unpack_words(packed)
+    except (FileNotFoundError, ValueError):
+        words = tuple(read_word_file(path))
+        packed = None
+        if all(word.isascii() and word.isalpha() for word in words):
+            packed = pack_words(words)
+            _save_packed(packed, cache_path)
+            packed = np.load(cache_path, mmap_mode='r')
+    _words[path] = words
+    _packed[path] = packed
+    return words
+
+
+# Packed uint32 form of a word list (None if it has letters outside a-z)
+def load_packed(path):
+    path = os.path.abspath(path)
+    load_vocabulary(path)
+    return _packed[path]
+
+
+# Possible answers (wordle_targets.txt)
+def get_answers():
+    return load_vocabulary(TARGETS_FILE)
+
+
+# Every valid guess (wordle_bank.txt)
+def get_guesses():
+    return load_vocabulary(BANK_FILE)
+
+
+def answer_array():
+    return load_packed(TARGETS_FILE)
+
+
+def guess_array():
+    return load_packed(BANK_FILE)
@@ -0,0 +1,129 @@
+# Wordle page helpers shared by the automation scripts
+# WordlePage wraps the WebDriver so a turn costs two round trips: the guess and Enter go out as
+# one key batch, and a single async script waits on the board through a MutationObserver (no
+# fixed sleeps) and returns every tile's letter and state. The scripts can also point at a local
+# mock of the board (mock_wordle.html) so a solve can be timed offline:
+# python entropyAlgo/entropy_automation.py mock [answer]
+
+import os
+import pathlib
+import time
+from urllib.parse import urlencode
+
+from selenium.webdriver.common.by import By
+
+ROW_SELECTOR = "div.Row-module_row__pwpBq"
+TILE_SELECTOR = "div.Tile-module_tile__UWEHN"
+REVEALED_STATES = ["correct", "present", "absent"]  # data-state of a tile once it has flipped
+REVEAL_TIMEOUT = 10  # seconds to wait for a row to be revealed
+MOCK_PAGE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mock_wordle.html")
+ENTER = "\ue007"
+FEEDBACK_BY_STATE = {"correct": "g", "present": "y", "absent": "."}
+
+# [letter, state] of every tile, one list per non-empty row
+READ_BOARD_JS = """
+function readBoard(rowSelector, tileSelector) {
+    return Array.from(document.querySelectorAll(rowSelector), row =>
+        Array.from(row.querySelectorAll(tileSelector),
+                   tile => [tile.getAttribute('data-letter'), tile.getAttribute('data-state')])
+    ).filter(row => row.length);
+}
+"""
+
+READ_BOARD_SCRIPT = READ_BOARD_JS + "return readBoard(arguments[0], arguments[1]);"
+
+# Resolves with the board once every tile of the row has a revealed data-state, watching attribute changes
+WAIT_FOR_ROW_SCRIPT = READ_BOARD_JS + """
+const [rowIndex, rowSelector, tileSelector, states, done] = arguments;
+function revealed() {
+    const row = document.querySelectorAll(rowSelector)[rowIndex];
+    if (!row) return false;
+    const tiles = Array.from(row.querySelectorAll(tileSelector));
+    return tiles.length === 5 && tiles.every(tile => states.includes(tile.getAttribute('data-state')));
+}
+if (revealed()) {
+    done(readBoard(rowSelector, tileSelector));
+} else {
+    const observer = new MutationObserver(() => {
+        if (revealed()) {
+            observer.disconnect();
+            done(readBoard(rowSelector, tileSelector));
+        }
+    });
+    observer.observe(document.body, {subtree: true, attributes: true, attributeFilter: ['data-state']});
+}
+"""
+
+
+def _board_rows(rows):
+    return [[(letter, state) for letter, state in row] for row in rows]
+
+
+# Letters and states of the whole board in one script call
+def read_board(driver):
+    return _board_rows(driver.execute_script(READ_BOARD_SCRIPT, ROW_SELECTOR, TILE_SELECTOR))
+
+
+# g/y/. feedback of a board row (tiles without a revealed state count as gray)
+def row_feedback(row):
+    return "".join(FEEDBACK_BY_STATE.get(state, ".") for _, state in row)
+
+
+class WordlePage:
+    def __init__(self, driver, reveal_timeout=REVEAL_TIMEOUT):
+        self.driver = driver
+        self._body = None
+        self.turn_seconds = []  # typing the guess to reading its feedback, per turn
+        driver.set_script_timeout(reveal_timeout)
+        self.round_trips = 1  # WebDriver calls made through the page
+
+    @property
+    def body(self):
+        if self._body is None:
+            self._body = self.driver.find_element(By.TAG_NAME, "body")
+            self.round_trips += 1
+        return self._body
+
+    def read_board(self):
+        self.round_trips += 1
+        return read_board(self.driver)
+
+    # Type the guess and Enter as one key batch
+    def type_guess(self, guess):
+        self.round_trips += 1
+        self.body.send_keys(guess + ENTER)
+
+    # Block until the row's tiles have all flipped (selenium's TimeoutException after the reveal
+    # timeout), then return the whole board from the same round trip
+    def wait_for_row(self, row):
+        self.round_trips += 1
+        return _board_rows(self.driver.execute_async_script(WAIT_FOR_ROW_SCRIPT, row, ROW_SELECTOR, TILE_SELECTOR,
+                                                            REVEALED_STATES))
+
+    # Play the guess on the row and return (feedback, board) once its tiles have flipped
+    def play(self, guess, row, while_waiting=None):
+        start = time.perf_counter()
+        self.type_guess(guess)
+        if while_waiting is not None:
+            while_waiting()
+        board = self.wait_for_row(row)
+        self.turn_seconds.append(time.perf_counter() - start)
+        return row_feedback(board[row]), board
+
+    def stats(self):
+        if not self.turn_seconds:
+            return f"{self.round_trips} WebDriver round trips"
+        mean = sum(self.turn_seconds) / len(self.turn_seconds)
+        return (f"{mean:.2f}s per turn over {len(self.turn_seconds)} turns, "
+                f"{self.round_trips / len(self.turn_seconds):.1f} WebDriver round trips per turn")
+
+
+# file:// URL of the mock board, optionally with a fixed answer and flip time per tile
+def mock_url(answer=None, flip_ms=None):
+    params = {}
+    if answer:
+        params["answer"] = answer
+    if flip_ms is not None:
+        params["flip"] = flip_ms
+    url = pathlib.Path(MOCK_PAGE).as_uri()
+    return f"{url}?{urlencode(params)}" if params else url